@@ -1,8 +1,12 @@
 import streamlit as st
 import pandas as pd
 from datetime import date
-import subprocess  # For external process call
 import matplotlib.pyplot as plt
+import numpy as np
+
+from simulator import run_date_only, run_full_match, run_no_result
+from simulator.backends import BACKENDS, DEFAULT_BACKEND
+from simulator.result_store import load_result, load_summary
 
 def order_combined_season(season_df):
     """
@@ -41,6 +45,23 @@ def order_simulated_matches(matches, ascending=True):
     df["date"] = df["date"].dt.strftime("%m/%d/%Y")
     return df.to_dict("records")
 
+def plot_npi_distribution(result, team, title):
+    """Histogram of ``team``'s NPIs from a simulation result or summary."""
+    fig, ax = plt.subplots()
+    if hasattr(result, "team_histogram"):
+        counts, edges = result.team_histogram(team)
+        ax.stairs(counts / max(counts.sum(), 1) / np.diff(edges), edges, fill=True)
+    else:
+        ax.hist(result.team_npis(team), bins='auto', density=True)
+    ax.set_title(title)
+    ax.set_xlabel("NPI")
+    ax.set_ylabel("Probability Density")
+    return fig
+
+def team_cutoff_probabilities(summary, team):
+    """One-row table of ``team``'s probabilities of finishing within each NPI-rank cutoff."""
+    return summary.cutoff_probabilities().set_index("team").loc[[team]]
+
 # Initialize session state variables.
 if "reference_season_df" not in st.session_state:
     st.session_state.reference_season_df = None
@@ -104,6 +125,27 @@ elif st.session_state.simulated_mode == "Date-Only Entry (Auto-generate schedule
         "Enter number of ELO simulations", min_value=1, value=30, step=1
     )
     st.write(f"Number of ELO simulations: {elo_num_simulations}")
+
+backend = st.selectbox(
+    "Computation backend (python is the slow reference implementation)",
+    BACKENDS,
+    index=BACKENDS.index(DEFAULT_BACKEND),
+)
+
+if st.session_state.simulated_mode != "Full Match Entry (Date, Teams, and Result)":
+    keep_known_results = st.checkbox(
+        "Keep the reference season's results (only simulate the entered matches)",
+        value=False,
+    )
+    summarize = st.checkbox(
+        "Summary only (running statistics instead of every simulation, for large runs)",
+        value=False,
+    )
+    warm_start = st.checkbox(
+        "Warm-start NPIs from the reference season (needs the reference results kept)",
+        value=False,
+        disabled=not keep_known_results,
+    ) and keep_known_results
 # ---------- END NEW ----------
 
 # ---------- MAIN WORKFLOW ----------
@@ -207,95 +249,104 @@ if st.session_state.reference_season_df is not None:
             else:
                 combined = filtered_season.copy()
             combined = order_combined_season(combined)
-            combined.to_csv("data/combined_simulated_season.csv", index=False)
-            st.success("Combined season saved")
+            st.success("Combined season ready")
             st.dataframe(combined)
 
             # Full Match Mode
             if st.session_state.simulated_mode == "Full Match Entry (Date, Teams, and Result)":
-                proc = subprocess.run(
-                    ["python", "scripts/full_match_mode/full_match_entry.py", "data/combined_simulated_season.csv"],
-                    capture_output=True, text=True
-                )
-                if proc.returncode != 0:
-                    st.error(proc.stderr)
+                try:
+                    result = run_full_match(combined, backend=backend)
+                except Exception as e:
+                    st.error(f"Simulation failed: {e}")
                 else:
-                    dfp = pd.read_csv("scripts/full_match_mode/data/processed_result.csv")
-                    if "npi" in dfp.columns:
-                        st.table(dfp.sort_values("npi", ascending=False)[["team", "npi"]])
-                    else:
-                        st.dataframe(dfp)
+                    dfp = result.to_frame()
+                    st.table(dfp[["team", "npi"]])
 
             # No-Result Mode
             elif st.session_state.simulated_mode == "Match Entry Without Result (Date and Teams Only)":
-                proc = subprocess.run(
-                    ["python", "scripts/no_result_mode/no_results_entry.py",
-                     "data/combined_simulated_season.csv", str(elo_num_simulations)],
-                    capture_output=True, text=True
-                )
-                if proc.returncode != 0:
-                    st.error(proc.stderr)
+                try:
+                    result = run_no_result(
+                        combined,
+                        elo_num_simulations,
+                        sample_known_results=not keep_known_results,
+                        summarize=summarize,
+                        warm_start=warm_start,
+                        backend=backend,
+                    )
+                except Exception as e:
+                    st.error(f"Simulation failed: {e}")
                 else:
-                    dfp = pd.read_csv("scripts/no_result_mode/data/processed_result.csv")
+                    dfp = result.to_frame()
                     st.dataframe(dfp)
                     # Plot
-                    row = dfp[dfp.team == selected_team]
-                    if not row.empty:
-                        cols = [c for c in dfp.columns if c.startswith("npi_")]
-                        vals = row[cols].iloc[0].astype(float).tolist()
-                        fig, ax = plt.subplots()
-                        ax.hist(vals, density=True)
-                        ax.set_title(f"NPI Distribution for {selected_team}")
-                        ax.set_xlabel("NPI")
-                        ax.set_ylabel("Probability density")
-                        st.pyplot(fig)
+                    if selected_team in result.teams:
+                        st.pyplot(plot_npi_distribution(
+                            result, selected_team, f"NPI Distribution for {selected_team}"
+                        ))
+                        summary = result if summarize else result.summary
+                        st.table(team_cutoff_probabilities(summary, selected_team))
 
             # Date-Only Mode
             elif st.session_state.simulated_mode == "Date-Only Entry (Auto-generate schedule)":
-                st.info("Processing date-only entries with external process...")
-                proc = subprocess.run(
-                    ["python",
-                     "scripts/date_only_mode/date_only_entry.py",
-                     "data/combined_simulated_season.csv",
-                     str(elo_num_simulations),
-                     str(schedule_num_simulations)],
-                    capture_output=True, text=True
-                )
-                if proc.returncode != 0:
-                    st.error(proc.stderr)
+                st.info("Processing date-only entries...")
+                try:
+                    result = run_date_only(
+                        combined,
+                        elo_num_simulations,
+                        schedule_num_simulations,
+                        sample_known_results=not keep_known_results,
+                        summarize=summarize,
+                        warm_start=warm_start,
+                        backend=backend,
+                    )
+                except Exception as e:
+                    st.error(f"Simulation failed: {e}")
                 else:
-                    st.success("External date-only process completed successfully!")
+                    st.success("Date-only simulation completed successfully!")
 
-                    # NEW: read and plot ALL merged-NPI CSVs
-                from pathlib import Path
+                    for sched_idx, simulation in enumerate(result.simulations, start=1):
+                        if summarize:
+                            df_npi = simulation.to_frame()
+                        else:
+                            df_npi = simulation.to_frame(first_sim=1)
+                        st.subheader(f"NPI Results for Schedule #{sched_idx}")
+                        st.dataframe(df_npi)
 
-                # point at your npis folder
-                npi_folder = Path("scripts/date_only_mode/result/npis")
-                npi_files = sorted(
-                    npi_folder.glob("schedule_*_npi.csv"),
-                    key=lambda p: int(p.stem.split("_")[1])
-                )
+                        # plot this team’s NPIs
+                        if selected_team not in simulation.teams:
+                            st.warning(f"No NPI data for {selected_team} in schedule #{sched_idx}")
+                            continue
 
-                for sched_idx, npi_file in enumerate(npi_files, start=1):
-                    df_npi = pd.read_csv(npi_file)
-                    st.subheader(f"NPI Results for Schedule #{sched_idx}")
-                    st.dataframe(df_npi)
+                        st.pyplot(plot_npi_distribution(
+                            simulation,
+                            selected_team,
+                            f"Schedule {sched_idx}: NPI Distribution for {selected_team}",
+                        ))
+                        summary = simulation if summarize else simulation.summary
+                        st.table(team_cutoff_probabilities(summary, selected_team))
 
-                    # extract this team’s NPIs
-                    team_row = df_npi[df_npi['team'] == selected_team]
-                    if team_row.empty:
-                        st.warning(f"No NPI data for {selected_team} in {npi_file.name}")
-                        continue
-
-                    npi_cols = sorted(
-                        [c for c in df_npi.columns if c.startswith("npi_")],
-                        key=lambda c: int(c.split("_")[1])
-                    )
-                    vals = team_row[npi_cols].iloc[0].astype(float).tolist()
-
-                    fig, ax = plt.subplots()
-                    ax.hist(vals, bins='auto', density=True)
-                    ax.set_title(f"Schedule {sched_idx}: NPI Distribution for {selected_team}")
-                    ax.set_xlabel("NPI")
-                    ax.set_ylabel("Probability Density")
-                    st.pyplot(fig)
\ No newline at end of file
+# ---------- SAVED RESULTS ----------
+st.header("View Saved Simulation Results")
+saved_path = st.text_input(
+    "Path of a saved NPI matrix (.npy) or summary (.npz) written by the no-result or date-only entry"
+)
+if saved_path:
+    try:
+        if saved_path.endswith(".npz"):
+            saved = load_summary(saved_path)
+            num_sims = saved.count
+        else:
+            # Memory-mapped, so only the selected team's row is read from disk
+            saved = load_result(saved_path)
+            num_sims = saved.npis.shape[1]
+    except Exception as e:
+        st.error(f"Failed to load results: {e}")
+    else:
+        st.write(f"{len(saved.teams)} teams, {num_sims} simulations (seed {saved.seed})")
+        saved_team = st.selectbox("Team", saved.teams)
+        st.pyplot(plot_npi_distribution(
+            saved, saved_team, f"NPI Distribution for {saved_team}"
+        ))
+        saved_summary = saved if hasattr(saved, "cutoff_probabilities") else saved.summary
+        if saved_summary is not None:
+            st.table(team_cutoff_probabilities(saved_summary, saved_team))
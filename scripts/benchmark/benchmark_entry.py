@@ -0,0 +1,122 @@
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from simulator.backends import BACKENDS
+from simulator.benchmark import (
+    REGRESSION_THRESHOLD,
+    BenchmarkConfig,
+    compare_benchmarks,
+    load_benchmarks,
+    run_benchmarks,
+    save_benchmarks,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+
+def main(
+    config,
+    backends=BACKENDS,
+    stages=None,
+    output_path=None,
+    baseline_path=BASELINE_PATH,
+    save_baseline=False,
+    threshold=REGRESSION_THRESHOLD,
+):
+    """Run the benchmarks and compare them with the stored baseline.
+
+    Returns True when no stage regressed against the baseline.
+    """
+    results = run_benchmarks(config, backends, stages)
+    for name, timing in results["results"].items():
+        print(f"{name:<30} best {timing['best']:.4f}s  median {timing['median']:.4f}s")
+
+    if output_path is not None:
+        save_benchmarks(results, output_path)
+        print(f"Benchmark results saved to {output_path}")
+
+    if save_baseline:
+        save_benchmarks(results, baseline_path)
+        print(f"Baseline saved to {baseline_path}")
+        return True
+
+    if not Path(baseline_path).exists():
+        print(f"No baseline at {baseline_path}; run with --save-baseline to store one")
+        return True
+
+    comparison = compare_benchmarks(results, load_benchmarks(baseline_path), threshold)
+    print(comparison.to_string(index=False))
+    regressions = comparison.loc[comparison["regression"], "stage"].tolist()
+    if regressions:
+        print(f"Regressions beyond {threshold:.0%}: {', '.join(regressions)}")
+    return not regressions
+
+
+if __name__ == "__main__":
+    defaults = BenchmarkConfig()
+    parser = argparse.ArgumentParser(description="Time the simulator on a synthetic season.")
+    parser.add_argument("--teams", type=int, default=defaults.teams, help="teams in the season")
+    parser.add_argument(
+        "--games-per-team", type=int, default=defaults.games_per_team, help="games played by each team"
+    )
+    parser.add_argument("--sims", type=int, default=defaults.sims, help="Elo simulations per schedule")
+    parser.add_argument(
+        "--schedules", type=int, default=defaults.schedules, help="schedules of the date-only mode"
+    )
+    parser.add_argument(
+        "--new-games",
+        type=int,
+        default=defaults.new_games,
+        help="games of the selected team left without an opponent in the date-only mode",
+    )
+    parser.add_argument("--repeats", type=int, default=defaults.repeats, help="timed calls per stage")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=defaults.workers,
+        help="worker processes for the Elo simulations (0 uses every core)",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="seed of the synthetic season")
+    parser.add_argument(
+        "--backends", choices=BACKENDS, nargs="+", default=list(BACKENDS), help="backends to time"
+    )
+    parser.add_argument("--stages", nargs="+", default=None, help="only time these stages")
+    parser.add_argument("--output", default=None, help="write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", default=str(BASELINE_PATH), help="baseline JSON to compare against"
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="store this run as the baseline instead of comparing",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=REGRESSION_THRESHOLD,
+        help="slowdown fraction reported as a regression (default: %(default)s)",
+    )
+    args = parser.parse_args()
+
+    passed = main(
+        BenchmarkConfig(
+            teams=args.teams,
+            games_per_team=args.games_per_team,
+            sims=args.sims,
+            schedules=args.schedules,
+            new_games=args.new_games,
+            repeats=args.repeats,
+            workers=args.workers,
+            seed=args.seed,
+        ),
+        backends=args.backends,
+        stages=args.stages,
+        output_path=args.output,
+        baseline_path=args.baseline,
+        save_baseline=args.save_baseline,
+        threshold=args.threshold,
+    )
+    sys.exit(0 if passed else 1)
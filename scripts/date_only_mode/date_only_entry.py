@@ -1,19 +1,38 @@
 # src/myapp/main.py
+import argparse
 import sys
-import time
 import pandas as pd
 from pathlib import Path
 
-from load_games import load_games
-from load_teams import load_teams
-from process_games_iteration import process_games_iteration
-from elo_simulation import predict_result
-from schedule_generator import fill_schedule
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-def main(data_path, num_elo_iteration, num_schedule_simulations):
-    NUM_ITERATIONS    = 30
-    elo_base_path     = "scripts/no_result_mode/data/elo_start_25.csv"
-    elo_base          = pd.read_csv(elo_base_path)
+from simulator import generate_schedules, load_elo_table, simulate_schedules
+from simulator.backends import BACKENDS, DEFAULT_BACKEND
+from simulator.npi_solver import MAX_ITERATIONS, TOLERANCE, parse_tolerance
+from simulator.parallel import parse_count
+from simulator.result_store import save_result, save_summary
+from simulator.seeding import resolve_seed
+from simulator.summary import CUTOFFS
+
+def main(
+    data_path,
+    num_elo_iteration,
+    num_schedule_simulations,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    workers=1,
+    seed=None,
+    sample_known_results=True,
+    output_format="npy",
+    summarize=False,
+    cutoffs=CUTOFFS,
+    rank_depth=None,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    seed = resolve_seed(seed)
+    print(f"Seed: {seed}")
+    elo_base          = load_elo_table()
     schedule_template = pd.read_csv(data_path, index_col=False)
 
     # Base result folder for date‑only mode
@@ -30,69 +49,132 @@ def main(data_path, num_elo_iteration, num_schedule_simulations):
         else:
             d.mkdir(parents=True, exist_ok=True)
 
-    for sched in range(num_schedule_simulations):
-        print(f"\n=== Running schedule simulation {sched+1}/{num_schedule_simulations} ===")
-        
-        # 1) generate & fix one schedule
-        schedule = schedule_template.copy()
-        fill_schedule(schedule, elo_base)
-
-        # 2) save raw schedule CSV
+    # 1) generate & save every schedule up front
+    schedules = generate_schedules(
+        schedule_template, elo_base, num_schedule_simulations, seed
+    )
+    for sched, schedule in enumerate(schedules):
         schedule_csv = schedules_dir / f"schedule_{sched+1}.csv"
         schedule.to_csv(schedule_csv, index=False)
         print(f"Saved raw schedule to {schedule_csv}")
 
-        # 3) run the Elo sims on that schedule
-        npi_dfs = []
-        for sim in range(num_elo_iteration):
-            elo = elo_base.copy()
-            data = predict_result(
-                elo,
-                schedule,
-                scaling_factor=400,
-                update_factor=133
-            )
-            valid_teams = load_teams(data)
-            games       = load_games(data, valid_teams)
-
-            opponent_npis = {t: 50 for t in valid_teams}
-            final_teams   = None
-            start = time.time()
-            for i in range(NUM_ITERATIONS):
-                teams = process_games_iteration(
-                    games, valid_teams, opponent_npis, i+1
-                )
-                if i+1 == NUM_ITERATIONS:
-                    final_teams = teams
-                opponent_npis = {
-                    tid: stats["npi"]
-                    for tid, stats in teams.items()
-                    if stats["has_games"]
-                }
-            print(f"  Elo sim {sim+1} done in {time.time()-start:.2f}s")
+    # 2) run the Elo sims of every schedule, saving each schedule once complete
+    for sched, result in simulate_schedules(
+        elo_base,
+        schedules,
+        num_elo_iteration,
+        workers=workers,
+        seed=seed,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        sample_known_results=sample_known_results,
+        summarize=summarize,
+        cutoffs=cutoffs,
+        rank_depth=rank_depth,
+        warm_start=warm_start,
+        backend=backend,
+    ):
+        summary = result if summarize else result.summary
+        (low, high), max_residual = summary.iterations, summary.max_residual
+        print(
+            f"  Schedule {sched+1}: {low}-{high} NPI iterations "
+            f"per Elo sim (max residual {max_residual:.2e})"
+        )
 
-            npi_dfs.append(pd.DataFrame([
-                {"team": team, f"npi_{sim+1}": stats.get("npi")}
-                for team, stats in final_teams.items()
-            ]))
-
-        # 4) merge all Elo‐simulation DataFrames for this schedule
-        merged = npi_dfs[0]
-        for df_sim in npi_dfs[1:]:
-            merged = pd.merge(merged, df_sim, on="team", how="outer")
-
-        # 5) save merged NPI results CSV
-        npi_csv = npi_dir / f"schedule_{sched+1}_npi.csv"
-        merged.to_csv(npi_csv, index=False)
-        print(f"Saved merged NPIs to {npi_csv}")
+        # 3) save the schedule's NPI matrix, or its summary
+        npi_path = npi_dir / f"schedule_{sched+1}_npi"
+        if summarize:
+            npi_path = save_summary(result, npi_dir / f"schedule_{sched+1}_summary")
+        elif output_format == "csv":
+            npi_path = npi_path.with_suffix(".csv")
+            result.to_frame(first_sim=1).to_csv(npi_path, index=False)
+        else:
+            npi_path = save_result(result, npi_path)
+        print(f"Saved merged NPIs to {npi_path}")
 
     print("All schedule simulations complete.")
 
 if __name__ == "__main__":
-    if len(sys.argv) < 4:
-        print("Usage: python main.py <path_to_csv> <num_elo_iteration> <num_schedule_simulations>")
-        sys.exit(1)
-    csv_path = sys.argv[1]
-    num_elo_iter = int(sys.argv[2])
-    num_sched_sims = int(sys.argv[3])
-    main(csv_path, num_elo_iter, num_sched_sims)
+    parser = argparse.ArgumentParser(description="Simulate a season with auto-generated opponents.")
+    parser.add_argument("csv_path", help="combined season CSV")
+    parser.add_argument("num_elo_iteration", type=parse_count, help="number of Elo simulations per schedule")
+    parser.add_argument("num_schedule_simulations", type=parse_count, help="number of schedules to generate")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for the Elo simulations (0 uses every core)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument(
+        "--keep-known-results",
+        action="store_true",
+        help="only simulate the games lacking a result; real results update Elo as played",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("npy", "csv"),
+        default="npy",
+        help="npy writes each NPI matrix with a JSON team sidecar; csv one npi_k column per simulation",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="keep running per-team statistics instead of every simulation's NPIs",
+    )
+    parser.add_argument(
+        "--cutoffs",
+        type=int,
+        nargs="+",
+        default=list(CUTOFFS),
+        help="NPI ranks whose finishing probabilities are reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rank-depth",
+        type=int,
+        default=None,
+        help="NPI ranks whose finishing distribution is kept (default: every rank)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="start every simulation's NPI iteration from the reference season's converged NPIs "
+        "(requires --keep-known-results)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Elo replay and NPI implementation; python is the slow reference (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-iterations",
+        type=int,
+        default=MAX_ITERATIONS,
+        help="largest number of NPI passes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=parse_tolerance,
+        default=TOLERANCE,
+        help="stop once no NPI moves by this much in a pass; 'none' runs every pass (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    if args.warm_start and not args.keep_known_results:
+        parser.error("--warm-start requires --keep-known-results")
+    main(
+        args.csv_path,
+        args.num_elo_iteration,
+        args.num_schedule_simulations,
+        max_iterations=args.max_iterations,
+        tolerance=args.tolerance,
+        workers=args.workers,
+        seed=args.seed,
+        sample_known_results=not args.keep_known_results,
+        output_format=args.output_format,
+        summarize=args.summary,
+        cutoffs=args.cutoffs,
+        rank_depth=args.rank_depth,
+        warm_start=args.warm_start,
+        backend=args.backend,
+    )
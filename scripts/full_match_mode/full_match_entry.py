@@ -1,60 +1,48 @@
 # src/myapp/main.py
+import argparse
 import time
 import sys
+import pandas as pd
 from pathlib import Path
 
-from load_games import load_games
-from load_teams import load_teams
-from process_games_iteration import process_games_iteration
-from save_npi_results_to_csv import save_npi_results_to_csv
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
+from simulator import run_full_match
+from simulator.backends import BACKENDS, DEFAULT_BACKEND
+from simulator.load_games import format_load_stats
+from simulator.npi_solver import MAX_ITERATIONS, TOLERANCE, parse_tolerance
+from simulator.save_npi_results_to_csv import save_npi_results_to_csv
 
-def main(data_path):
+
+def main(data_path, max_iterations=MAX_ITERATIONS, tolerance=TOLERANCE, backend=DEFAULT_BACKEND):
     """Main entry point for the application."""
     print(data_path)
-    data_path = data_path
-    NUM_ITERATIONS = 30
 
     try:
-        valid_teams = load_teams(data_path)
-        games = load_games(data_path, valid_teams)
-        print(f"Total number of loaded games: {len(games)}")
+        season = pd.read_csv(data_path)
 
         start_total_time = time.time()
-        # Initialize once
-        opponent_npis = {team_id: 50 for team_id in valid_teams}
-        final_teams = None
-        total_games = 0
-
-        for i in range(NUM_ITERATIONS):
-            iteration_number = i + 1
-
-            teams = process_games_iteration(
-                games, valid_teams, opponent_npis, iteration_number
-            )
-
-            if iteration_number == NUM_ITERATIONS:
-                final_teams = teams
-                save_npi_results_to_csv(teams)
-
-                # Calculate total games in final iteration
-                for team_id, team_data in teams.items():
-                    total_games += len(team_data["all_game_npis"])
+        result = run_full_match(season, max_iterations, tolerance, backend)
+        print(f"Loaded {len(result.teams)} teams")
+        print(format_load_stats(result.load_stats))
+        final_teams, convergence = result.teams, result.convergence
+        save_npi_results_to_csv(
+            final_teams, Path(__file__).parent / "data" / "processed_result.csv"
+        )
 
-            # Update in place for next iteration
-            opponent_npis.clear()
-            opponent_npis.update(
-                {
-                    team_id: stats["npi"]
-                    for team_id, stats in teams.items()
-                    if stats["has_games"]
-                }
-            )
+        # Calculate total games in final iteration
+        total_games = sum(
+            len(team_data["all_game_npis"]) for team_data in final_teams.values()
+        )
 
         total_time = time.time() - start_total_time
         print(f"\nTotal processing time: {total_time:.3f} seconds")
-        print(f"Average time per iteration: {total_time/NUM_ITERATIONS:.3f} seconds")
-        print(f"Total number of games in the data: {len(games)}")
+        print(f"Average time per iteration: {total_time/convergence['iterations']:.3f} seconds")
+        print(
+            f"NPI iterations: {convergence['iterations']} "
+            f"(residual {convergence['residual']:.2e})"
+        )
+        print(f"Total number of games in the data: {total_games // 2}")
         print(f"Total number of games processed in the final iteration: {total_games}")
 
         return final_teams
@@ -65,8 +53,25 @@ def main(data_path):
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Usage: python process_full_matches.py <path_to_csv>")
-        sys.exit(1)
-    csv_path = sys.argv[1]
-    main(csv_path)
+    parser = argparse.ArgumentParser(description="Compute the NPIs of a season with known results.")
+    parser.add_argument("csv_path", help="combined season CSV")
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="NPI implementation; python is the slow reference (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-iterations",
+        type=int,
+        default=MAX_ITERATIONS,
+        help="largest number of NPI passes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=parse_tolerance,
+        default=TOLERANCE,
+        help="stop once no NPI moves by this much in a pass; 'none' runs every pass (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    main(args.csv_path, args.max_iterations, args.tolerance, backend=args.backend)
@@ -1,92 +1,179 @@
 # src/myapp/main.py
-import time
+import argparse
 import sys
-import pandas as pd
+import time
 from pathlib import Path
 
-from load_games import load_games
-from load_teams import load_teams
-from process_games_iteration import process_games_iteration
-from save_npi_results_to_csv import save_npi_results_to_csv
-from elo_simulation import predict_result
-
-def main(data_path, num_elo_iteration):
-    """Main entry point for the application."""
-    NUM_ITERATIONS = 30
-    elo_base_path = "scripts/no_result_mode/data/elo_start_25.csv"
-    elo_base = pd.read_csv(elo_base_path)
-    schedule = pd.read_csv(data_path)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-    npi_results = []
-    for sim in range(num_elo_iteration):
-        elo = elo_base.copy()
-        data = predict_result(elo, schedule, scaling_factor=400, update_factor=133)
-        try:
-            valid_teams = load_teams(data)
-            games = load_games(data, valid_teams)
-            start_total_time = time.time()
-            # Initialize once
-            opponent_npis = {team_id: 50 for team_id in valid_teams}
-            final_teams = None
-            total_games = 0
+from simulator import run_no_result
+from simulator.api import ELO_BASE_PATH
+from simulator.backends import BACKENDS, DEFAULT_BACKEND
+from simulator.npi_solver import MAX_ITERATIONS, TOLERANCE, parse_tolerance
+from simulator.parallel import parse_count
+from simulator.result_store import save_result, save_summary
+from simulator.season_cache import CACHE_DIR, cached_season
+from simulator.summary import CUTOFFS
+from simulator.seeding import resolve_seed
 
-            for i in range(NUM_ITERATIONS):
-                iteration_number = i + 1
-                
-                teams = process_games_iteration(
-                    games, valid_teams, opponent_npis, iteration_number
-                )
-
-                if iteration_number == NUM_ITERATIONS:
-                    final_teams = teams
+def main(
+    data_path,
+    num_elo_iteration,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    workers=1,
+    seed=None,
+    sample_known_results=True,
+    cache_dir=CACHE_DIR,
+    output_format="npy",
+    summarize=False,
+    cutoffs=CUTOFFS,
+    rank_depth=None,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    """Main entry point for the application."""
+    seed = resolve_seed(seed)
+    print(f"Seed: {seed}")
 
-                    # Calculate total games in final iteration
-                    for team_id, team_data in teams.items():
-                        total_games += len(team_data["all_game_npis"])
+    start_total_time = time.time()
+    try:
+        # Compiled season and Elo table, reused across runs on the same CSVs
+        season, elo_table = cached_season(
+            data_path, ELO_BASE_PATH, sample_known_results, cache_dir
+        )
+        print(f"Season ready in {time.time() - start_total_time:.3f} seconds")
 
-                # Update in place for next iteration
-                opponent_npis.clear()
-                opponent_npis.update(
-                    {
-                        team_id: stats["npi"]
-                        for team_id, stats in teams.items()
-                        if stats["has_games"]
-                    }
-                )
+        result = run_no_result(
+            season,
+            num_elo_iteration,
+            elo_table=elo_table,
+            workers=workers,
+            seed=seed,
+            max_iterations=max_iterations,
+            tolerance=tolerance,
+            sample_known_results=sample_known_results,
+            summarize=summarize,
+            cutoffs=cutoffs,
+            rank_depth=rank_depth,
+            warm_start=warm_start,
+            backend=backend,
+        )
+    except Exception as e:
+        print(f"Error processing: {e}")
+        raise
 
-            total_time = time.time() - start_total_time
-            print(f"\nTotal processing time: {total_time:.3f} seconds")
-            print(f"Average time per iteration: {total_time/NUM_ITERATIONS:.3f} seconds")
-            print(f"Total number of games in the data: {len(games)}")
-            print(f"Total number of games processed in the final iteration: {total_games}")
+    total_time = time.time() - start_total_time
+    summary = result if summarize else result.summary
+    (low, high), max_residual = summary.iterations, summary.max_residual
+    print(f"\nTotal processing time: {total_time:.3f} seconds")
+    print(f"Average time per simulation: {total_time/num_elo_iteration:.3f} seconds")
+    print(f"NPI iterations per simulation: {low}-{high} (max residual {max_residual:.2e})")
+    print(summary.to_frame().head(10).to_string(index=False))
 
-            final_teams_df = pd.DataFrame([
-                {"team": team, f"npi_{sim}": stats.get("npi", None)}
-                for team, stats in final_teams.items()
-            ])
-            npi_results.append(final_teams_df)
+    if summarize:
+        output_path = save_summary(result, Path(__file__).parent / "data" / "processed_summary")
+        print(f"Simulation summary saved to {output_path}")
+        return result
 
-        except Exception as e:
-            print(f"Error processing: {e}")
-            raise
-    
-    merged_sim_df = npi_results[0]
-    for sim_df in npi_results[1:]:
-        merged_sim_df = pd.merge(merged_sim_df, sim_df, on="team", how="outer")
-    
-    # Save the final result to a CSV file.
-    output_path = Path(__file__).parent / "data" / "processed_result.csv"
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    merged_sim_df.to_csv(output_path, index=False)
+    # Save the final result as a binary NPI matrix or a wide CSV.
+    output_path = Path(__file__).parent / "data" / "processed_result"
+    if output_format == "csv":
+        output_path = output_path.with_suffix(".csv")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        result.to_frame().to_csv(output_path, index=False)
+    else:
+        output_path = save_result(result, output_path)
     print(f"Final simulation results saved to {output_path}")
-    
-    return merged_sim_df
+
+    return result
 
 if __name__ == "__main__":
-    if len(sys.argv) < 3:
-        print("Usage: python process_full_matches.py <path_to_csv>")
-        sys.exit(1)
-    csv_path = sys.argv[1]
-    num_elo_iteration = int(sys.argv[2])
+    parser = argparse.ArgumentParser(description="Simulate a season without match results.")
+    parser.add_argument("csv_path", help="combined season CSV")
+    parser.add_argument("num_elo_iteration", type=parse_count, help="number of Elo simulations")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes for the Elo simulations (0 uses every core)",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for a reproducible run")
+    parser.add_argument(
+        "--keep-known-results",
+        action="store_true",
+        help="only simulate the games lacking a result; real results update Elo as played",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="compile the season from the CSV instead of using the on-disk cache",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=("npy", "csv"),
+        default="npy",
+        help="npy writes the NPI matrix with a JSON team sidecar; csv one npi_k column per simulation",
+    )
+    parser.add_argument(
+        "--summary",
+        action="store_true",
+        help="keep running per-team statistics instead of every simulation's NPIs",
+    )
+    parser.add_argument(
+        "--cutoffs",
+        type=int,
+        nargs="+",
+        default=list(CUTOFFS),
+        help="NPI ranks whose finishing probabilities are reported (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--rank-depth",
+        type=int,
+        default=None,
+        help="NPI ranks whose finishing distribution is kept (default: every rank)",
+    )
+    parser.add_argument(
+        "--warm-start",
+        action="store_true",
+        help="start every simulation's NPI iteration from the reference season's converged NPIs "
+        "(requires --keep-known-results)",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=DEFAULT_BACKEND,
+        help="Elo replay and NPI implementation; python is the slow reference (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--max-iterations",
+        type=int,
+        default=MAX_ITERATIONS,
+        help="largest number of NPI passes (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=parse_tolerance,
+        default=TOLERANCE,
+        help="stop once no NPI moves by this much in a pass; 'none' runs every pass (default: %(default)s)",
+    )
+    args = parser.parse_args()
+    if args.warm_start and not args.keep_known_results:
+        parser.error("--warm-start requires --keep-known-results")
 
-    main(csv_path, num_elo_iteration)
+    main(
+        args.csv_path,
+        args.num_elo_iteration,
+        max_iterations=args.max_iterations,
+        tolerance=args.tolerance,
+        workers=args.workers,
+        seed=args.seed,
+        sample_known_results=not args.keep_known_results,
+        cache_dir=None if args.no_cache else CACHE_DIR,
+        output_format=args.output_format,
+        summarize=args.summary,
+        cutoffs=args.cutoffs,
+        rank_depth=args.rank_depth,
+        warm_start=args.warm_start,
+        backend=args.backend,
+    )
@@ -0,0 +1,29 @@
+"""NCAA volleyball season simulator.
+
+Importable entry points for the full-match, no-result and date-only modes.
+"""
+from .api import (
+    DateOnlyResult,
+    FullMatchResult,
+    SimulationResult,
+    generate_schedules,
+    load_elo_table,
+    run_date_only,
+    run_full_match,
+    run_no_result,
+    simulate_schedules,
+)
+from .summary import NPISummary
+
+__all__ = [
+    "DateOnlyResult",
+    "FullMatchResult",
+    "NPISummary",
+    "SimulationResult",
+    "generate_schedules",
+    "load_elo_table",
+    "run_date_only",
+    "run_full_match",
+    "run_no_result",
+    "simulate_schedules",
+]
@@ -0,0 +1,300 @@
+"""In-process entry points for the three simulation modes.
+
+Each ``run_*`` function takes the combined season as a DataFrame and returns
+a result object, so callers such as the Streamlit UI and batch jobs do not
+go through CSV files and subprocesses.
+"""
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .backends import DEFAULT_BACKEND
+from .load_games import load_games
+from .load_teams import load_teams
+from .npi_solver import MAX_ITERATIONS, TOLERANCE, solve_npi
+from .parallel import check_warm_start, run_replicates, schedule_teams
+from .schedule_generator import SeasonTemplate
+from .season_table import SeasonTable
+from .seeding import resolve_seed, schedule_rng
+from .summary import CUTOFFS, NPISummary
+
+ELO_BASE_PATH = Path(__file__).resolve().parent / "data" / "elo_start_25.csv"
+
+
+def load_elo_table(path=ELO_BASE_PATH):
+    """Read the starting Elo table used by the simulated modes."""
+    return pd.read_csv(path)
+
+
+@dataclass
+class FullMatchResult:
+    """NPIs of a season whose results are all known."""
+
+    teams: dict
+    convergence: dict
+    load_stats: dict
+
+    def to_frame(self):
+        """One row per team with games, ranked by NPI."""
+        frame = pd.DataFrame(
+            [
+                {
+                    "team": team["team_name"],
+                    "games": team["games"],
+                    "wins": team["wins"],
+                    "losses": team["losses"],
+                    "qualifying_wins": team["qualifying_wins"],
+                    "qualifying_losses": team["qualifying_losses"],
+                    "npi": team["npi"],
+                }
+                for team in self.teams.values()
+                if team["has_games"]
+            ],
+            columns=[
+                "team",
+                "games",
+                "wins",
+                "losses",
+                "qualifying_wins",
+                "qualifying_losses",
+                "npi",
+            ],
+        )
+        frame = frame.sort_values("npi", ascending=False, ignore_index=True)
+        frame["rank"] = np.arange(1, len(frame) + 1)
+        return frame
+
+
+@dataclass
+class SimulationResult:
+    """NPIs of every Elo replicate of one schedule.
+
+    ``npis`` is a (teams, simulations) matrix whose rows follow ``teams``.
+    ``summary`` holds the statistics, rank distribution and cutoff
+    probabilities gathered while the replicates ran.
+    """
+
+    teams: list
+    npis: np.ndarray
+    convergence: list
+    seed: int
+    summary: NPISummary = None
+
+    def to_frame(self, first_sim=0):
+        """Team column followed by one ``npi_<sim>`` column per replicate."""
+        frame = pd.DataFrame(
+            self.npis,
+            columns=[f"npi_{first_sim + sim}" for sim in range(self.npis.shape[1])],
+        )
+        frame.insert(0, "team", self.teams)
+        return frame
+
+    def team_npis(self, team):
+        """NPIs of ``team`` across all replicates, empty if it is not scheduled."""
+        if team not in self.teams:
+            return np.empty(0)
+        return self.npis[self.teams.index(team)]
+
+
+@dataclass
+class DateOnlyResult:
+    """Generated schedules and the simulated NPIs of each of them."""
+
+    schedules: list
+    simulations: list
+    seed: int
+
+
+def simulate_schedules(
+    elo_table,
+    schedules,
+    num_elo_iteration,
+    workers=1,
+    seed=None,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    sample_known_results=True,
+    summarize=False,
+    cutoffs=CUTOFFS,
+    rank_depth=None,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    """Run the Elo replicates of every schedule.
+
+    Yields ``(schedule_index, SimulationResult)`` as soon as all replicates
+    of a schedule are done. ``schedules`` may mix DataFrames and compiled
+    ``SeasonTable``s. ``sample_known_results=False`` keeps the real results
+    and only samples the games lacking one. Every replicate is folded into
+    an ``NPISummary`` tracking the NPI-rank ``cutoffs`` and the first
+    ``rank_depth`` ranks (all of them by default) as it completes;
+    with ``summarize=True`` only the summary is kept and yielded, so memory
+    does not grow with ``num_elo_iteration``. ``warm_start=True`` starts
+    every replicate's NPI iteration from the converged NPIs of the recorded
+    season instead of 50 for every team; it requires
+    ``sample_known_results=False``. ``backend`` selects the Elo replay
+    and NPI implementations (see ``backends``).
+    """
+    seed = resolve_seed(seed)
+    teams = [
+        schedule.teams if isinstance(schedule, SeasonTable) else schedule_teams(schedule)
+        for schedule in schedules
+    ]
+    summaries = [
+        NPISummary(names, seed, cutoffs=cutoffs, rank_depth=rank_depth) for names in teams
+    ]
+    if not summarize:
+        npi_matrices = [
+            np.full((len(names), num_elo_iteration), np.nan) for names in teams
+        ]
+        convergence = [[None] * num_elo_iteration for _ in schedules]
+    remaining = [num_elo_iteration] * len(schedules)
+
+    for schedule_index, sim, npis, sim_convergence in run_replicates(
+        elo_table,
+        schedules,
+        num_elo_iteration,
+        workers=workers,
+        seed=seed,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        sample_known_results=sample_known_results,
+        warm_start=warm_start,
+        backend=backend,
+    ):
+        summaries[schedule_index].update(npis, sim_convergence)
+        if not summarize:
+            npi_matrices[schedule_index][:, sim] = npis
+            convergence[schedule_index][sim] = sim_convergence
+        remaining[schedule_index] -= 1
+        if remaining[schedule_index]:
+            continue
+
+        summary, summaries[schedule_index] = summaries[schedule_index], None
+        if summarize:
+            yield schedule_index, summary
+            continue
+
+        yield schedule_index, SimulationResult(
+            teams[schedule_index],
+            npi_matrices[schedule_index],
+            convergence[schedule_index],
+            seed,
+            summary,
+        )
+
+
+def generate_schedules(season, elo_table, num_schedule_simulations, seed):
+    """Fill the missing opponents of ``season`` once per schedule simulation.
+
+    Each schedule is the date-sorted, renumbered season returned by
+    ``fill_schedule``. The season is parsed and sorted once and every
+    schedule only places its filled games into that order.
+    """
+    template = SeasonTemplate(season)
+    return [
+        template.fill(elo_table, rng=schedule_rng(seed, sched))
+        for sched in range(num_schedule_simulations)
+    ]
+
+
+def run_full_match(
+    season, max_iterations=MAX_ITERATIONS, tolerance=TOLERANCE, backend=DEFAULT_BACKEND
+):
+    """Compute the NPIs of a season whose results are all known."""
+    valid_teams = load_teams(season)
+    games, load_stats = load_games(season, valid_teams)
+    teams, convergence = solve_npi(games, valid_teams, max_iterations, tolerance, backend)
+    return FullMatchResult(teams, convergence, load_stats)
+
+
+def run_no_result(
+    season,
+    num_elo_iteration,
+    elo_table=None,
+    workers=1,
+    seed=None,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    sample_known_results=True,
+    summarize=False,
+    cutoffs=CUTOFFS,
+    rank_depth=None,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    """Simulate the results of ``season`` with Elo and compute NPIs per replicate.
+
+    ``season`` is a DataFrame or a ``SeasonTable`` already compiled against
+    ``elo_table``, e.g. by ``season_cache.cached_season``. Returns a
+    ``SimulationResult``, or an ``NPISummary`` with ``summarize=True``.
+    """
+    elo_table = load_elo_table() if elo_table is None else elo_table
+    seed = resolve_seed(seed)
+
+    _, result = next(
+        simulate_schedules(
+            elo_table,
+            [season],
+            num_elo_iteration,
+            workers=workers,
+            seed=seed,
+            max_iterations=max_iterations,
+            tolerance=tolerance,
+            sample_known_results=sample_known_results,
+            summarize=summarize,
+            cutoffs=cutoffs,
+            rank_depth=rank_depth,
+            warm_start=warm_start,
+            backend=backend,
+        )
+    )
+    return result
+
+
+def run_date_only(
+    season,
+    num_elo_iteration,
+    num_schedule_simulations,
+    elo_table=None,
+    workers=1,
+    seed=None,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    sample_known_results=True,
+    summarize=False,
+    cutoffs=CUTOFFS,
+    rank_depth=None,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    """Fill the missing opponents of ``season`` and simulate every generated schedule.
+
+    With ``summarize=True`` the simulations are ``NPISummary`` objects.
+    """
+    check_warm_start(warm_start, sample_known_results)
+    elo_table = load_elo_table() if elo_table is None else elo_table
+    seed = resolve_seed(seed)
+
+    schedules = generate_schedules(season, elo_table, num_schedule_simulations, seed)
+    simulations = [None] * num_schedule_simulations
+    for schedule_index, result in simulate_schedules(
+        elo_table,
+        schedules,
+        num_elo_iteration,
+        workers=workers,
+        seed=seed,
+        max_iterations=max_iterations,
+        tolerance=tolerance,
+        sample_known_results=sample_known_results,
+        summarize=summarize,
+        cutoffs=cutoffs,
+        rank_depth=rank_depth,
+        warm_start=warm_start,
+        backend=backend,
+    ):
+        simulations[schedule_index] = result
+
+    return DateOnlyResult(schedules, simulations, seed)
@@ -0,0 +1,19 @@
+"""Selection of the implementation behind the Elo replay and NPI passes.
+
+``"numpy"`` runs the vectorized kernels built from NumPy ufuncs,
+``np.bincount``/``np.minimum.at`` and ``np.lexsort``. ``"python"`` runs plain
+per-game and per-team loops following the steps of the original code, using
+only the standard library in the hot loops; it is the readable reference the
+NumPy kernels are benchmarked against, and a fallback should a kernel
+misbehave. Both are tested against a copy of the original solver loop.
+"""
+
+BACKENDS = ("numpy", "python")
+DEFAULT_BACKEND = "numpy"
+
+
+def check_backend(backend):
+    """Return ``backend`` if it is one of ``BACKENDS``, else raise ValueError."""
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend!r}, expected one of {BACKENDS}")
+    return backend
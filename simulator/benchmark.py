@@ -0,0 +1,226 @@
+"""Reproducible timings of the simulator's hot paths on synthetic seasons.
+
+A synthetic season of configurable size is generated from a seed, each
+stage is timed over a few repeats, and the results are kept as a JSON
+document that later runs can be compared against to catch regressions.
+"""
+import json
+import os
+import platform
+import time
+from dataclasses import asdict, dataclass
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from .api import run_date_only, run_full_match, run_no_result
+from .backends import BACKENDS
+from .calculate_owp import calculate_owp, game_index
+from .elo_engine import simulate_results
+from .elo_simulation import predict_result
+from .load_games import load_games
+from .load_teams import load_teams
+from .npi_solver import MAX_ITERATIONS, TOLERANCE, solve_npi
+from .process_games_iteration import process_games_iteration
+
+# A run slower than the baseline by more than this fraction is a regression
+REGRESSION_THRESHOLD = 0.2
+
+SEASON_START = date(2024, 8, 30)
+SEASON_DAYS = 80
+
+
+@dataclass
+class BenchmarkConfig:
+    """Size of the synthetic season and of the simulated runs.
+
+    Every team plays about ``games_per_team`` games. The first team is the
+    selected team of the date-only mode, whose last ``new_games`` games
+    lack an opponent.
+    """
+
+    teams: int = 100
+    games_per_team: int = 24
+    sims: int = 20
+    schedules: int = 2
+    new_games: int = 4
+    repeats: int = 3
+    workers: int = 1
+    seed: int = 0
+
+
+def synthetic_elo_table(config):
+    """Elo table of ``config.teams`` teams with normally spread ratings."""
+    rng = np.random.default_rng(config.seed)
+    return pd.DataFrame(
+        {
+            "team": [f"Team {position:03d}" for position in range(config.teams)],
+            "elo_rating": rng.normal(1500, 200, config.teams),
+            "wins": 0,
+            "games": 0,
+        }
+    )
+
+
+def synthetic_season(config, elo_table):
+    """Combined season CSV frame with random pairings, dates and 3-x scores."""
+    rng = np.random.default_rng([config.seed, 1])
+    num_games = config.teams * config.games_per_team // 2
+    home = rng.integers(config.teams, size=num_games)
+    away = (home + rng.integers(1, config.teams, size=num_games)) % config.teams
+    days = np.sort(rng.integers(SEASON_DAYS, size=num_games))
+    home_won = rng.random(num_games) < 0.5
+    loser_sets = rng.integers(3, size=num_games)
+
+    teams = elo_table["team"].to_numpy()
+    season = pd.DataFrame(
+        {
+            "date": [
+                (SEASON_START + timedelta(days=day)).strftime("%m/%d/%Y")
+                for day in days.tolist()
+            ],
+            "team": teams[home],
+            "opponent": teams[away],
+            "WL": np.where(home_won, "W", "L"),
+            "home_score": np.where(home_won, 3, loser_sets),
+            "away_score": np.where(home_won, loser_sets, 3),
+        }
+    )
+    season["game_number"] = season.groupby(["date", "team", "opponent"]).cumcount() + 1
+    return season
+
+
+def date_only_season(config, season, elo_table):
+    """``season`` with the selected team's last games' opponents left blank."""
+    season = season.copy()
+    selected = elo_table["team"].iloc[0]
+    rows = np.flatnonzero(season["team"].to_numpy() == selected)
+    rows = rows[max(len(rows) - config.new_games, 0):]
+    season.loc[rows, "opponent"] = ""
+    return season
+
+
+def time_call(function, repeats):
+    """Best and median wall time of ``repeats`` calls of ``function``."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return {
+        "best": min(timings),
+        "median": float(np.median(timings)),
+        "repeats": repeats,
+    }
+
+
+def run_benchmarks(config=None, backends=BACKENDS, stages=None):
+    """Time every stage on a synthetic season built from ``config``.
+
+    ``stages`` restricts the run to the named stages. Returns a JSON-ready
+    dict with the config, the environment and each stage's timings.
+    """
+    config = BenchmarkConfig() if config is None else config
+    elo_table = synthetic_elo_table(config)
+    season = synthetic_season(config, elo_table)
+    valid_teams = load_teams(season)
+    games, _ = load_games(season, valid_teams)
+    index = game_index(games, valid_teams)
+    previous_npis = {team_id: 50.0 for team_id in valid_teams}
+    rng = np.random.default_rng([config.seed, 2])
+
+    calls = {
+        "predict_result": lambda: predict_result(elo_table.copy(), season, rng=rng),
+        "simulate_results": lambda: simulate_results(elo_table.copy(), season, rng=rng),
+        "load_games": lambda: load_games(season, valid_teams),
+        "calculate_owp": lambda: calculate_owp(games, valid_teams),
+        # One pass of a solve, which builds the game index once for all passes
+        "process_games_iteration": lambda: process_games_iteration(
+            games, valid_teams, previous_npis, iteration_number=2, index=index
+        ),
+    }
+    for backend in backends:
+        calls.update(
+            {
+                f"solve_npi[{backend}]": lambda backend=backend: solve_npi(
+                    games, valid_teams, MAX_ITERATIONS, TOLERANCE, backend
+                ),
+                f"full_match[{backend}]": lambda backend=backend: run_full_match(
+                    season, backend=backend
+                ),
+                f"no_result[{backend}]": lambda backend=backend: run_no_result(
+                    season,
+                    config.sims,
+                    elo_table=elo_table,
+                    workers=config.workers,
+                    seed=config.seed,
+                    backend=backend,
+                ),
+                f"date_only[{backend}]": lambda backend=backend: run_date_only(
+                    date_only_season(config, season, elo_table),
+                    config.sims,
+                    config.schedules,
+                    elo_table=elo_table,
+                    workers=config.workers,
+                    seed=config.seed,
+                    backend=backend,
+                ),
+            }
+        )
+    if stages is not None:
+        unknown = set(stages) - set(calls)
+        if unknown:
+            raise ValueError(f"Unknown benchmark stages: {sorted(unknown)}")
+        calls = {name: call for name, call in calls.items() if name in stages}
+
+    return {
+        "config": asdict(config),
+        "environment": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "results": {name: time_call(call, config.repeats) for name, call in calls.items()},
+    }
+
+
+def save_benchmarks(results, path):
+    """Write ``results`` to ``path`` as indented JSON."""
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2)
+
+
+def load_benchmarks(path):
+    """Read results written by ``save_benchmarks``."""
+    with open(path) as file:
+        return json.load(file)
+
+
+def compare_benchmarks(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """Best times of the stages in both runs, with their ratio to the baseline.
+
+    Returns a DataFrame with a ``regression`` column flagging the stages
+    slower than the baseline by more than ``threshold``. Raises ValueError
+    when the two runs used different configs; timings are also only
+    comparable on the same hardware.
+    """
+    if results["config"] != baseline["config"]:
+        raise ValueError(
+            f"Benchmark configs differ: {results['config']} vs baseline {baseline['config']}"
+        )
+    rows = [
+        {
+            "stage": name,
+            "baseline": baseline["results"][name]["best"],
+            "current": timing["best"],
+        }
+        for name, timing in results["results"].items()
+        if name in baseline["results"]
+    ]
+    frame = pd.DataFrame(rows, columns=["stage", "baseline", "current"])
+    frame["ratio"] = frame["current"] / frame["baseline"]
+    frame["regression"] = frame["ratio"] > 1 + threshold
+    return frame
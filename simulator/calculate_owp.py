@@ -0,0 +1,50 @@
+import numpy as np
+
+from .npi_solver import build_game_index, index_games
+
+
+def owp_from_arrays(team, opponent, won, tied, num_teams):
+    """Opponents' winning percentage from per-side game arrays.
+
+    Each opponent's record is adjusted for its head-to-head result against
+    the team, as in the original per-opponent loop.
+    """
+    lost = ~won & ~tied
+    wins = np.bincount(team[won], minlength=num_teams)
+    losses = np.bincount(team[lost], minlength=num_teams)
+
+    opponent_wins = wins[opponent] - lost
+    opponent_losses = losses[opponent] - won
+
+    total_wins = np.bincount(team, weights=opponent_wins, minlength=num_teams)
+    total_losses = np.bincount(team, weights=opponent_losses, minlength=num_teams)
+    total_games = total_wins + total_losses
+
+    owp = np.full(num_teams, 50.0)
+    np.divide(total_wins, total_games, out=owp, where=total_games > 0)
+    owp[total_games > 0] *= 100
+    return owp
+
+
+def game_index(games, valid_teams):
+    """``GameIndex`` of ``games`` with per-entry ``won``/``tied`` in index order.
+
+    Returns ``(index, won, tied)``. A caller running several passes over the
+    same games builds it once and passes it to ``calculate_owp`` and
+    ``process_games_iteration``; it must be rebuilt after editing ``games``.
+    """
+    team_ids = list(valid_teams)
+    team_index = {team_id: position for position, team_id in enumerate(team_ids)}
+    team, opponent, won, tied = index_games(games, team_index)
+    index = build_game_index(team, opponent, len(team_ids))
+    return index, won[index.order], tied[index.order]
+
+
+def calculate_owp(games, valid_teams, index=None):
+    """Calculate OWP for every team.
+
+    ``index`` is the ``game_index`` of ``games``, built here when None.
+    """
+    index, won, tied = game_index(games, valid_teams) if index is None else index
+    owp = owp_from_arrays(index.team, index.opponent, won, tied, len(valid_teams))
+    return dict(zip(valid_teams, owp.tolist()))
@@ -0,0 +1,160 @@
+import numpy as np
+
+from .elo_simulation import calculate_expected_score, calculate_new_rating
+
+
+def build_team_index(elo_table):
+    """Map every team in the Elo table to its row position (first row wins)."""
+    team_index = {}
+    for position, team in enumerate(elo_table["team"]):
+        team_index.setdefault(team, position)
+    return team_index
+
+
+def encode_games(data, team_index):
+    """Return the home and away team indices of every row in ``data``."""
+    home = data["team"].map(team_index)
+    away = data["opponent"].map(team_index)
+
+    missing = set(data["team"][home.isna()]) | set(data["opponent"][away.isna()])
+    if missing:
+        raise ValueError(f"Teams missing from the Elo table: {sorted(missing, key=str)}")
+
+    return home.to_numpy(dtype=np.int64), away.to_numpy(dtype=np.int64)
+
+
+def replay_elo(
+    ratings,
+    home,
+    away,
+    draws,
+    scaling_factor=400,
+    update_factor=20,
+    simulated=None,
+    known_home_won=None,
+):
+    """Replay the games in order, drawing each result from ``draws``.
+
+    ``ratings`` is updated in place. A game is a home win when its uniform
+    draw falls below the home team's expected score. With a ``simulated``
+    mask, ``draws`` only has an entry per simulated game and the other games
+    update Elo with ``known_home_won``, as in ``replay_elo_batch``. Returns
+    a boolean array of home wins.
+    """
+    home_won = np.empty(len(home), dtype=bool)
+    current = ratings.tolist()
+    if simulated is None:
+        simulated = np.ones(len(home), dtype=bool)
+        known_home_won = np.zeros(len(home), dtype=bool)
+    next_draw = iter(draws.tolist()).__next__
+
+    for g, (h, a, sampled, known) in enumerate(
+        zip(home.tolist(), away.tolist(), simulated.tolist(), known_home_won.tolist())
+    ):
+        home_rating = current[h]
+        away_rating = current[a]
+
+        expected_win = calculate_expected_score(home_rating, away_rating, scaling_factor)
+        if sampled:
+            WL = 1 if next_draw() < expected_win else 0
+        else:
+            WL = int(known)
+        home_won[g] = WL
+
+        current[h] = calculate_new_rating(home_rating, WL, expected_win, update_factor)
+        current[a] = calculate_new_rating(away_rating, 1 - WL, 1 - expected_win, update_factor)
+
+    ratings[:] = current
+    return home_won
+
+
+def replay_elo_batch(
+    ratings,
+    home,
+    away,
+    draws,
+    scaling_factor=400,
+    update_factor=20,
+    simulated=None,
+    known_home_won=None,
+):
+    """Replay the games for many independent seasons at once.
+
+    ``ratings`` is a (sims, teams) matrix updated in place and ``draws`` a
+    (sims, games) matrix of uniform draws. Every game is one vectorized
+    expected-score computation and one Bernoulli draw across all seasons.
+    If a ``simulated`` mask is given, ``draws`` only has a column per
+    simulated game and the other games update Elo with ``known_home_won``,
+    as ``calculate_elo`` does. Returns a (sims, games) boolean matrix of
+    home wins.
+    """
+    num_sims = len(ratings)
+    home_won = np.empty((num_sims, len(home)), dtype=bool)
+    if simulated is None:
+        simulated = np.ones(len(home), dtype=bool)
+        known_home_won = np.zeros(len(home), dtype=bool)
+    draw_columns = np.cumsum(simulated) - 1
+
+    for g, (h, a, sampled, column, known) in enumerate(
+        zip(
+            home.tolist(),
+            away.tolist(),
+            simulated.tolist(),
+            draw_columns.tolist(),
+            known_home_won.tolist(),
+        )
+    ):
+        home_rating = ratings[:, h]
+        away_rating = ratings[:, a]
+
+        expected_win = calculate_expected_score(home_rating, away_rating, scaling_factor)
+        WL = draws[:, column] < expected_win if sampled else known
+        home_won[:, g] = WL
+
+        new_home_rating = calculate_new_rating(home_rating, WL, expected_win, update_factor)
+        new_away_rating = calculate_new_rating(
+            away_rating, 1 - WL, 1 - expected_win, update_factor
+        )
+        ratings[:, h] = new_home_rating
+        ratings[:, a] = new_away_rating
+
+    return home_won
+
+
+def write_results(data, home_won):
+    """Copy of ``data`` with the ``WL``, ``home_score`` and ``away_score`` of ``home_won``."""
+    return data.assign(
+        WL=np.where(home_won, "W", "L"),
+        home_score=home_won.astype(int),
+        away_score=(~home_won).astype(int),
+    )
+
+
+def simulate_results(elo_table, data, scaling_factor=400, update_factor=20, rng=None):
+    """Array-backed replacement for ``predict_result``.
+
+    Samples every game of ``data`` in order and returns a copy with its
+    ``WL``, ``home_score`` and ``away_score`` columns filled, updating
+    ``elo_table`` the same way ``predict_result`` does. ``data`` is left
+    untouched. ``rng`` defaults to the global NumPy state.
+    """
+    rng = np.random if rng is None else rng
+
+    team_index = build_team_index(elo_table)
+    home, away = encode_games(data, team_index)
+
+    ratings = elo_table["elo_rating"].to_numpy(dtype=float, copy=True)
+    home_won = replay_elo(
+        ratings, home, away, rng.random(len(home)), scaling_factor, update_factor
+    )
+
+    num_teams = len(elo_table)
+    elo_table["elo_rating"] = ratings
+    elo_table["games"] += np.bincount(home, minlength=num_teams) + np.bincount(
+        away, minlength=num_teams
+    )
+    elo_table["wins"] += np.bincount(home[home_won], minlength=num_teams) + np.bincount(
+        away[~home_won], minlength=num_teams
+    )
+
+    return write_results(data, home_won)
@@ -1,8 +1,5 @@
 import pandas as pd
 import numpy as np
-import argparse
-import matplotlib.pyplot as plt
-import math
 
 
 def calculate_expected_score(team_rating, opp_team_rating, scaling_factor=400):
@@ -53,14 +50,20 @@ def calculate_elo(elo_table, data, scaling_factor=400, update_factor=20):
     return elo_table
 
 
-def predict_result(elo_table, data, scaling_factor=400, update_factor=20):
-    #add prediction column to data
-    data['predicted_WL'] = "W"
+def predict_result(elo_table, data, scaling_factor=400, update_factor=20, rng=None):
+    """Sample every game of ``data`` in order from the Elo ratings.
 
-    for i, game in data.iterrows():
-        home_team = game['team']
-        away_team = game['opponent']
+    Returns a copy of ``data`` with the predicted ``WL``, ``home_score`` and
+    ``away_score``; ``data`` itself is left untouched. ``elo_table`` is
+    updated in place as the games are played. ``rng`` defaults to the
+    global NumPy state.
+    """
+    rng = np.random if rng is None else rng
 
+    # Outcomes go to a buffer and are written to the copy once at the end
+    home_won = np.empty(len(data), dtype=bool)
+
+    for i, (home_team, away_team) in enumerate(zip(data['team'], data['opponent'])):
         # Add game played
         elo_table.loc[elo_table['team'] == home_team, 'games'] += 1
         elo_table.loc[elo_table['team'] == away_team, 'games'] += 1
@@ -71,15 +74,11 @@ def predict_result(elo_table, data, scaling_factor=400, update_factor=20):
 
         #determine who will win
         expected_win = calculate_expected_score(home_rating, away_rating, scaling_factor)
-        WL =  np.random.binomial(n=1, p=expected_win)
+        WL =  rng.binomial(n=1, p=expected_win)
         #print(WL)
 
         # Add predicted count
-        data.loc[i, 'WL'] = "W" if WL == 1 else "L"
-
-        # change the score
-        data.at[i, 'home_score'] = 1 if WL == 1 else 0
-        data.at[i, 'away_score'] = 0 if WL == 1 else 1
+        home_won[i] = WL == 1
 
         # Add win count
         if WL == 1:
@@ -99,10 +98,17 @@ def predict_result(elo_table, data, scaling_factor=400, update_factor=20):
         elo_table.loc[elo_table['team'] == home_team, 'elo_rating'] = new_home_rating
         elo_table.loc[elo_table['team'] == away_team, 'elo_rating'] = new_away_rating
 
-    return data
+    return data.assign(
+        predicted_WL="W",
+        WL=np.where(home_won, "W", "L"),
+        home_score=home_won.astype(int),
+        away_score=(~home_won).astype(int),
+    )
+
 
+def train_update_factor(elo_table, data, scaling_factor=400, update_factor=20, rng=None):
+    rng = np.random if rng is None else rng
 
-def train_update_factor(elo_table, data, scaling_factor=400, update_factor=20):
     #add prediction column to data
     data['predicted_Expected_win'] = 0.0
     data['square_error'] = 0.0
@@ -126,7 +132,7 @@ def train_update_factor(elo_table, data, scaling_factor=400, update_factor=20):
 
         #determine who will win
         expected_win = calculate_expected_score(home_rating, away_rating, scaling_factor)
-        Predicted_WL =  np.random.binomial(n=1, p=expected_win)
+        Predicted_WL =  rng.binomial(n=1, p=expected_win)
         data.loc[i, 'predicted_WL'] = Predicted_WL
         #print(WL)
 
@@ -164,12 +170,14 @@ def cross_season(elo_table, P = 0.5):
     elo_table['elo_rating'] = elo_table['elo_rating']*P + (1-P)*1505
     return elo_table
 
-def predict_new_schedule(schedule, prev_elo_path, schedule_path):
+def predict_new_schedule(schedule, prev_elo_path, schedule_path, rng=None):
     elo_24 = pd.read_csv(prev_elo_path)
     data24  = pd.read_csv(schedule_path)
     elo_after_23 =  calculate_elo(elo_24, data24, scaling_factor=400, update_factor=133)
     elo_start_24 = cross_season(elo_after_23, P = 0.8)
-    predicted_schedule = predict_result(elo_start_24, schedule, scaling_factor=400, update_factor=133)
+    predicted_schedule = predict_result(
+        elo_start_24, schedule, scaling_factor=400, update_factor=133, rng=rng
+    )
     return predicted_schedule 
 
 #FINAL PARAMETER P = 0.8, UPDATE_FACTOR = 133
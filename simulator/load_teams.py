@@ -0,0 +1,5 @@
+def load_teams(df):
+    # Ensure any missing values are removed and strip whitespace.
+    team_names = set(df["team"].dropna().str.strip())
+    opponent_names = set(df["opponent"].dropna().str.strip())
+    return {name: name for name in team_names.union(opponent_names)}
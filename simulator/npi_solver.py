@@ -0,0 +1,394 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from .backends import DEFAULT_BACKEND, check_backend
+from .calculate_game_npi import calculate_game_npi
+
+NUM_TOP_WINS = 10
+
+# Defaults used by the entry points
+MAX_ITERATIONS = 30
+TOLERANCE = 1e-5
+
+
+def parse_tolerance(text):
+    """Command-line tolerance: a float, or ``none`` to always run ``max_iterations`` passes."""
+    return None if text.strip().lower() == "none" else float(text)
+
+
+def index_games(games, team_index):
+    """Convert the games list into per-side team-index arrays.
+
+    Every counted game contributes two entries, the team1 side followed by the
+    team2 side, so each team's entries stay in game order. Games with an
+    unknown team or a 0-0 score are dropped, as in ``process_games_iteration``.
+    Returns ``(team, opponent, won, tied)`` arrays.
+    """
+    team, opponent, won, tied = [], [], [], []
+
+    for game in games:
+        team1_id = game["team1_id"]
+        team2_id = game["team2_id"]
+        team1_score = game["team1_score"]
+        team2_score = game["team2_score"]
+
+        if (
+            team1_id not in team_index
+            or team2_id not in team_index
+            or (team1_score == 0 and team2_score == 0)
+        ):
+            continue
+
+        team1 = team_index[team1_id]
+        team2 = team_index[team2_id]
+        team.extend((team1, team2))
+        opponent.extend((team2, team1))
+        won.extend((team1_score > team2_score, team2_score > team1_score))
+        tied.extend((team1_score == team2_score,) * 2)
+
+    return (
+        np.array(team, dtype=np.int64),
+        np.array(opponent, dtype=np.int64),
+        np.array(won, dtype=bool),
+        np.array(tied, dtype=bool),
+    )
+
+
+def index_game_arrays(team1, team2, team1_score, team2_score):
+    """``index_games`` for the integer-coded arrays of ``load_game_arrays``.
+
+    The loader already dropped 0-0 games and unknown teams, so every game
+    yields its team1 side followed by its team2 side.
+    """
+    return (
+        np.column_stack((team1, team2)).ravel(),
+        np.column_stack((team2, team1)).ravel(),
+        np.column_stack((team1_score > team2_score, team2_score > team1_score)).ravel(),
+        np.repeat(team1_score == team2_score, 2),
+    )
+
+
+@dataclass
+class GameIndex:
+    """Per-team adjacency of a game set in compressed sparse row form.
+
+    Team ``t``'s entries are ``offsets[t]:offsets[t + 1]``, in game order,
+    and ``team``/``opponent`` hold every entry's team and opponent. ``order``
+    are the entries' positions in the per-side arrays the index was built
+    from, so ``won[order]`` puts per-side results in index order.
+    """
+
+    offsets: np.ndarray
+    team: np.ndarray
+    opponent: np.ndarray
+    order: np.ndarray
+
+    def to_sides(self, values):
+        """Per-side arrangement of ``values`` given in index order."""
+        sides = np.empty_like(values)
+        sides[self.order] = values
+        return sides
+
+
+def build_game_index(team, opponent, num_teams):
+    """``GameIndex`` of the per-side ``team``/``opponent`` arrays."""
+    order = np.argsort(team, kind="stable")
+    offsets = np.zeros(num_teams + 1, dtype=np.int64)
+    np.cumsum(np.bincount(team, minlength=num_teams), out=offsets[1:])
+    return GameIndex(offsets=offsets, team=team[order], opponent=opponent[order], order=order)
+
+
+def game_npis(won, opponent_npi):
+    """Vectorized ``calculate_game_npi``."""
+    win_component = np.where(won, 100.0, 0.0)
+    base_npi = (win_component * 0.20) + (opponent_npi * 0.80)
+
+    quality_bonus = np.where(won, np.maximum(0, (opponent_npi - 55.50) * 0.60), 0.0)
+
+    return base_npi + quality_bonus
+
+
+def select_used_games(team, won, npi, initial_npi, num_teams):
+    """Flag the game NPIs that count towards each team's NPI.
+
+    A win counts when it is among the team's ``NUM_TOP_WINS`` best wins or is
+    at least the team's current NPI. A loss counts when it equals the team's
+    worst loss or is below the team's current NPI.
+    """
+    used = np.zeros(len(team), dtype=bool)
+
+    # Rank each win within its team, best first
+    wins = np.flatnonzero(won)
+    wins = wins[np.lexsort((-npi[wins], team[wins]))]
+    win_teams = team[wins]
+    rank = np.arange(len(wins)) - np.searchsorted(win_teams, win_teams)
+    used[wins] = (rank < NUM_TOP_WINS) | (npi[wins] >= initial_npi[win_teams])
+
+    losses = np.flatnonzero(~won)
+    loss_teams = team[losses]
+    worst_loss = np.full(num_teams, np.inf)
+    np.minimum.at(worst_loss, loss_teams, npi[losses])
+    used[losses] = (npi[losses] == worst_loss[loss_teams]) | (
+        npi[losses] < initial_npi[loss_teams]
+    )
+
+    return used
+
+
+def npi_pass(npis, team, opponent, won, has_games):
+    """Run one NPI iteration on index arrays.
+
+    Returns the next NPI vector together with every entry's game NPI and
+    whether it was used. Teams without games keep their current NPI.
+    """
+    num_teams = len(npis)
+    npi = game_npis(won, npis[opponent])
+    used = select_used_games(team, won, npi, npis, num_teams)
+
+    used_count = np.bincount(team[used], minlength=num_teams)
+    used_total = np.bincount(team[used], weights=npi[used], minlength=num_teams)
+
+    next_npis = npis.copy()
+    np.divide(used_total, used_count, out=next_npis, where=has_games)
+    return next_npis, npi, used
+
+
+def npi_pass_python(npis, team, opponent, won, has_games):
+    """Pure-Python ``npi_pass`` following the per-team selection steps of the original solver.
+
+    Each team's wins are sorted best first and its losses worst first, and
+    its NPI is the plain sum of its used game NPIs in that order over their
+    count. Returns the same arrays as ``npi_pass``.
+    """
+    current = npis.tolist()
+    won = won.tolist()
+    npi = [
+        calculate_game_npi(game_won, current[opponent_position])
+        for game_won, opponent_position in zip(won, opponent.tolist())
+    ]
+    used = [False] * len(npi)
+
+    entries = {}
+    for entry, position in enumerate(team.tolist()):
+        entries.setdefault(position, []).append(entry)
+
+    next_npis = list(current)
+    for position, team_entries in entries.items():
+        initial_npi = current[position]
+        wins = sorted((entry for entry in team_entries if won[entry]), key=lambda entry: -npi[entry])
+        losses = sorted((entry for entry in team_entries if not won[entry]), key=npi.__getitem__)
+
+        for rank, entry in enumerate(wins):
+            used[entry] = rank < NUM_TOP_WINS or npi[entry] >= initial_npi
+        if losses:
+            worst_loss = npi[losses[0]]
+            for entry in losses:
+                used[entry] = npi[entry] == worst_loss or npi[entry] < initial_npi
+
+        used_npis = [npi[entry] for entry in wins + losses if used[entry]]
+        if has_games[position] and used_npis:
+            next_npis[position] = sum(used_npis) / len(used_npis)
+
+    return (
+        np.array(next_npis, dtype=float),
+        np.array(npi, dtype=float),
+        np.array(used, dtype=bool),
+    )
+
+
+def build_teams(valid_teams, team_ids, npis, team, won, tied, npi, used):
+    """Assemble the ``teams`` dict returned by ``process_games_iteration``."""
+    teams = {
+        team_id: {
+            "games": 0,
+            "wins": 0,
+            "losses": 0,
+            "ties": 0,
+            "npi": npis[position],
+            "game_npis": [],
+            "all_game_npis": [],
+            "team_id": team_id,
+            "team_name": valid_teams[team_id],
+            "qualifying_wins": 0,
+            "qualifying_losses": 0,
+            "has_games": False,
+        }
+        for position, team_id in enumerate(team_ids)
+    }
+
+    # Entries grouped by team, game order preserved
+    order = np.argsort(team, kind="stable")
+    for position, game_npi, game_won, game_tied in zip(
+        team[order].tolist(), npi[order].tolist(), won[order].tolist(), tied[order].tolist()
+    ):
+        team_data = teams[team_ids[position]]
+        team_data["has_games"] = True
+        team_data["games"] += 1
+        if game_won:
+            team_data["wins"] += 1
+        elif game_tied:
+            team_data["ties"] += 1
+        else:
+            team_data["losses"] += 1
+        team_data["all_game_npis"].append((game_npi, game_won))
+
+    # Used game NPIs: wins best first, then losses worst first
+    order = np.lexsort((np.where(won, -npi, npi), ~won, team))
+    order = order[used[order]]
+    for position, game_npi in zip(team[order].tolist(), npi[order].tolist()):
+        teams[team_ids[position]]["game_npis"].append(game_npi)
+
+    # A used game counts by its own result, even when a win and a loss share
+    # the same game NPI
+    qualifying_wins = np.bincount(team[used & won], minlength=len(team_ids))
+    qualifying_losses = np.bincount(team[used & ~won], minlength=len(team_ids))
+    for position, team_id in enumerate(team_ids):
+        teams[team_id]["qualifying_wins"] = int(qualifying_wins[position])
+        teams[team_id]["qualifying_losses"] = int(qualifying_losses[position])
+
+    return teams
+
+
+@dataclass
+class WarmStart:
+    """Converged solve of a reference set of outcomes, to start other solves from.
+
+    ``won`` are the reference outcomes of the entries and ``npis``, ``npi``
+    and ``used`` what ``iterate_npis`` returned for them.
+    """
+
+    won: np.ndarray
+    npis: np.ndarray
+    npi: np.ndarray
+    used: np.ndarray
+
+
+def warm_start(
+    team,
+    opponent,
+    won,
+    num_teams,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=None,
+    backend=DEFAULT_BACKEND,
+):
+    """Solve ``won`` from scratch and keep the result as a ``WarmStart``."""
+    npis, npi, used, _ = iterate_npis(
+        team, opponent, won, num_teams, max_iterations, tolerance, backend=backend
+    )
+    return WarmStart(won=won.copy(), npis=npis, npi=npi, used=used)
+
+
+def iterate_npis(
+    team,
+    opponent,
+    won,
+    num_teams,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=None,
+    start=None,
+    index=None,
+    backend=DEFAULT_BACKEND,
+):
+    """Run NPI passes on index arrays, starting from 50 for every team.
+
+    Iteration stops after ``max_iterations`` passes, or as soon as the
+    largest change in any team's NPI falls below ``tolerance``; with
+    ``tolerance=None`` exactly ``max_iterations`` passes are run.
+
+    With a ``WarmStart`` of the same entries, iteration starts from its NPIs
+    instead and a pass only recomputes the teams that can have moved: first
+    the teams with an outcome differing from ``start.won``, then the teams
+    whose NPI or an opponent's NPI changed by at least ``tolerance`` (at all
+    with None) in the previous pass. Once no team is left to recompute, a
+    full pass checks every team; iteration ends when it moves no team by
+    ``tolerance`` or more (by anything with None) and otherwise resumes
+    from the teams it moved. The stop test therefore sees the same full
+    residual as a cold start.
+
+    The passes run over the entries grouped by team; ``index`` is the
+    ``GameIndex`` of ``team`` and ``opponent``, built here when None, and
+    can be reused for every outcome of the same entries. ``backend``
+    selects ``npi_pass`` or ``npi_pass_python`` (see ``backends``).
+
+    Returns the NPI vector, the last pass's game NPIs and used flags, and a
+    dict holding the number of ``iterations`` run and the final ``residual``.
+    """
+    run_pass = npi_pass if check_backend(backend) == "numpy" else npi_pass_python
+    if index is None:
+        index = build_game_index(team, opponent, num_teams)
+    team, opponent, won = index.team, index.opponent, won[index.order]
+    has_games = np.diff(index.offsets) > 0
+
+    if start is None:
+        npis = np.full(num_teams, 50.0)
+        npi = np.zeros(len(team))
+        used = np.zeros(len(team), dtype=bool)
+        residual = np.inf
+        active = None
+    else:
+        npis = start.npis.copy()
+        npi, used = start.npi[index.order], start.used[index.order]
+        residual = 0.0
+        active = np.zeros(num_teams, dtype=bool)
+        active[team[won != start.won[index.order]]] = True
+
+    iterations = 0
+    while iterations < max_iterations:
+        full = active is None or not active.any()
+        if full:
+            next_npis, npi, used = run_pass(npis, team, opponent, won, has_games)
+        else:
+            # Inactive teams keep their NPI and the game NPIs of their entries
+            entries = np.flatnonzero(active[team])
+            next_npis, npi[entries], used[entries] = run_pass(
+                npis, team[entries], opponent[entries], won[entries], has_games & active
+            )
+        change = np.abs(next_npis - npis)
+        residual = float(np.max(change, initial=0.0))
+        npis = next_npis
+        iterations += 1
+
+        if start is None:
+            if tolerance is not None and residual < tolerance:
+                break
+            continue
+
+        # A warm start only stops on a full pass, which also catches the
+        # teams left behind by changes too small to propagate
+        moved = change >= tolerance if tolerance is not None else change > 0
+        if full and not moved.any():
+            break
+        active = moved.copy()
+        active[team[moved[opponent]]] = True
+
+    return (
+        npis,
+        index.to_sides(npi),
+        index.to_sides(used),
+        {"iterations": iterations, "residual": residual},
+    )
+
+
+def solve_npi(
+    games, valid_teams, max_iterations=MAX_ITERATIONS, tolerance=None, backend=DEFAULT_BACKEND
+):
+    """Vectorized replacement for repeated ``process_games_iteration`` calls.
+
+    Converts ``games`` to index arrays once and runs ``iterate_npis`` on
+    them with ``backend``. Returns the same ``teams`` structure as the final
+    ``process_games_iteration`` call, together with the convergence dict.
+    """
+    team_ids = list(valid_teams)
+    team_index = {team_id: position for position, team_id in enumerate(team_ids)}
+    team, opponent, won, tied = index_games(games, team_index)
+
+    npis, npi, used, convergence = iterate_npis(
+        team, opponent, won, len(team_ids), max_iterations, tolerance, backend=backend
+    )
+
+    teams = build_teams(
+        valid_teams, team_ids, npis.tolist(), team, won, tied, npi, used
+    )
+    return teams, convergence
@@ -0,0 +1,222 @@
+import argparse
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+
+import numpy as np
+
+from .backends import DEFAULT_BACKEND, check_backend
+from .npi_solver import MAX_ITERATIONS, TOLERANCE, build_game_index, iterate_npis
+from .season_table import SeasonTable, compile_season
+from .seeding import replicate_rng, resolve_seed
+
+# Replicates per task for each worker, so results stream back while the pool keeps busy
+TASKS_PER_WORKER = 4
+
+# Upper bound on the replicates of one task, which holds their draws and
+# outcomes for the whole schedule in memory at once
+MAX_TASK_SIMS = 256
+
+# Tasks in flight per worker; finished tasks are released as soon as their
+# results are yielded, so memory does not grow with the number of replicates
+PENDING_PER_WORKER = 2
+
+# Per-process copy of the data shared by every task, only set in pool
+# workers; in-process runs pass their own state so concurrent runs in one
+# process (e.g. UI sessions) stay apart
+_worker_state = {}
+
+
+def schedule_teams(schedule):
+    """Sorted names of every team in ``schedule``; the row order of NPI results."""
+    team_names = set(schedule["team"].dropna().str.strip())
+    opponent_names = set(schedule["opponent"].dropna().str.strip())
+    return sorted(team_names | opponent_names)
+
+
+def check_num_sims(num_sims):
+    """Return ``num_sims`` if it is at least 1, else raise ValueError."""
+    if num_sims < 1:
+        raise ValueError(f"Number of simulations must be at least 1, got {num_sims}")
+    return num_sims
+
+
+def parse_count(text):
+    """Command-line simulation or schedule count: an integer of at least 1."""
+    count = int(text)
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"expected a count of at least 1, got {text!r}")
+    return count
+
+
+def check_warm_start(warm_start, sample_known_results):
+    """Reject ``warm_start`` when every row is re-sampled.
+
+    Replicates then share few results with the recorded season, so they
+    start no closer to their NPIs than a cold start and run slower.
+    """
+    if warm_start and sample_known_results:
+        raise ValueError(
+            "warm_start needs sample_known_results=False; with every game "
+            "re-sampled a replicate shares too few results with the recorded season"
+        )
+
+
+def _task_state(seasons, settings, warm_starts):
+    """Data shared by every task of a run.
+
+    The per-team game index of every schedule is built here, once per run
+    in-process and once per worker process with a pool.
+    """
+    indexes = [
+        build_game_index(season.team, season.opponent, len(season.teams))
+        for season in seasons
+    ]
+    return {
+        "seasons": seasons,
+        "settings": settings,
+        "warm_starts": warm_starts,
+        "indexes": indexes,
+    }
+
+
+def _init_worker(seasons, settings, warm_starts):
+    """Receive the compiled schedules and settings once per worker process."""
+    _worker_state.update(_task_state(seasons, settings, warm_starts))
+
+
+def _run_worker_task(schedule_index, first_sim, num_sims, seed):
+    """``_run_task`` on the state of this worker process."""
+    return _run_task(_worker_state, schedule_index, first_sim, num_sims, seed)
+
+
+def _run_task(state, schedule_index, first_sim, num_sims, seed):
+    """Simulate a chunk of replicates of one schedule and compute their NPIs.
+
+    ``state`` comes from ``_task_state``. Every replicate draws from its own
+    ``replicate_rng`` stream, so results do not depend on how replicates are
+    chunked or on the number of workers.
+    """
+    settings = state["settings"]
+    season = state["seasons"][schedule_index]
+    start = state["warm_starts"][schedule_index]
+    index = state["indexes"][schedule_index]
+
+    num_simulated = int(season.simulated.sum())
+    draws = np.array(
+        [
+            replicate_rng(seed, schedule_index, sim).random(num_simulated)
+            for sim in range(first_sim, first_sim + num_sims)
+        ]
+    ).reshape(num_sims, num_simulated)
+    home_won, away_won = season.simulate(
+        draws, settings["scaling_factor"], settings["update_factor"], settings["backend"]
+    )
+
+    results = []
+    won = np.empty(len(season.team), dtype=bool)
+    for offset in range(num_sims):
+        season.side_won(home_won[offset], away_won[offset], out=won)
+        npis, _, _, convergence = iterate_npis(
+            season.team,
+            season.opponent,
+            won,
+            len(season.teams),
+            settings["max_iterations"],
+            settings["tolerance"],
+            start=start,
+            index=index,
+            backend=settings["backend"],
+        )
+        results.append((schedule_index, first_sim + offset, npis, convergence))
+
+    return results
+
+
+def _plan_tasks(num_schedules, num_sims, workers, seed):
+    """Split every schedule's replicates into chunks of consecutive simulations."""
+    chunk = min(MAX_TASK_SIMS, max(1, -(-num_sims // (workers * TASKS_PER_WORKER))))
+    return [
+        (schedule_index, first_sim, min(chunk, num_sims - first_sim), seed)
+        for schedule_index in range(num_schedules)
+        for first_sim in range(0, num_sims, chunk)
+    ]
+
+
+def run_replicates(
+    elo_base,
+    schedules,
+    num_sims,
+    workers=1,
+    seed=None,
+    max_iterations=MAX_ITERATIONS,
+    tolerance=TOLERANCE,
+    scaling_factor=400,
+    update_factor=133,
+    sample_known_results=True,
+    warm_start=False,
+    backend=DEFAULT_BACKEND,
+):
+    """Run ``num_sims`` Elo replicates of every schedule and compute their NPIs.
+
+    Every schedule is compiled into a ``SeasonTable`` once up front, unless
+    it already is one (e.g. from ``season_cache``). With
+    ``workers > 1`` replicates are fanned out over a process pool; the
+    compiled schedules are sent to each worker once at start-up. Yields
+    ``(schedule_index, sim_index, npis, convergence)`` for every replicate
+    as soon as its chunk completes, where ``npis`` is an NPI array in
+    ``schedule_teams`` order. ``seed`` selects the replicates' RNG streams
+    (see ``seeding``); None draws a fresh one. ``sample_known_results=False``
+    keeps the real results of the schedule and only samples the rows
+    lacking one (see ``compile_season``). With ``warm_start=True`` each
+    schedule's recorded season is solved once and every replicate's NPI
+    iteration starts from it (see ``SeasonTable.warm_start``); it requires
+    ``sample_known_results=False`` (see ``check_warm_start``). ``backend``
+    selects the Elo replay and NPI implementations (see ``backends``).
+    """
+    check_num_sims(num_sims)
+    check_warm_start(warm_start, sample_known_results)
+    seed = resolve_seed(seed)
+    workers = min(workers or os.cpu_count() or 1, num_sims * len(schedules))
+    settings = {
+        "max_iterations": max_iterations,
+        "tolerance": tolerance,
+        "scaling_factor": scaling_factor,
+        "update_factor": update_factor,
+        "backend": check_backend(backend),
+    }
+    tasks = _plan_tasks(len(schedules), num_sims, workers, seed)
+    seasons = [
+        schedule
+        if isinstance(schedule, SeasonTable)
+        else compile_season(
+            schedule, elo_base, schedule_teams(schedule), sample_known_results
+        )
+        for schedule in schedules
+    ]
+    warm_starts = [
+        season.warm_start(max_iterations, tolerance, backend) if warm_start else None
+        for season in seasons
+    ]
+
+    if workers <= 1:
+        state = _task_state(seasons, settings, warm_starts)
+        for task in tasks:
+            yield from _run_task(state, *task)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(seasons, settings, warm_starts),
+    ) as executor:
+        queued = iter(tasks)
+        pending = {
+            executor.submit(_run_worker_task, *task)
+            for task in islice(queued, workers * PENDING_PER_WORKER)
+        }
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            pending |= {executor.submit(_run_worker_task, *task) for task in islice(queued, len(done))}
+            for future in done:
+                yield from future.result()
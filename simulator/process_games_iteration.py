@@ -0,0 +1,95 @@
+import numpy as np
+
+from .calculate_owp import calculate_owp, game_index
+from .npi_solver import game_npis, select_used_games
+
+
+def process_games_iteration(
+    games, valid_teams, previous_iteration_npis=None, iteration_number=1, index=None
+):
+    # Callers iterating over the same games pass their game_index once built
+    if index is None:
+        index = game_index(games, valid_teams)
+    owp = calculate_owp(games, valid_teams, index)
+    index, index_won, index_tied = index
+
+    # Set up opponent_npis early
+    if iteration_number == 1:
+        opponent_npis = {team_id: 50 for team_id in valid_teams}
+    else:
+        opponent_npis = {}
+        for team_id in valid_teams:
+            opponent_npis[team_id] = previous_iteration_npis.get(team_id, owp[team_id])
+
+    # Initialize teams dict with all required keys
+    teams = {
+        team_id: {
+            "games": 0,
+            "wins": 0,
+            "losses": 0,
+            "ties": 0,
+            "npi": opponent_npis[team_id],
+            "game_npis": [],
+            "all_game_npis": [],
+            "team_id": team_id,
+            "team_name": team_name,
+            "qualifying_wins": 0,
+            "qualifying_losses": 0,
+            "has_games": False,
+        }
+        for team_id, team_name in valid_teams.items()
+    }
+
+    # Combine first two passes - record stats and calculate game NPIs,
+    # walking each team's entries of the game index in game order
+    team_ids = list(valid_teams)
+    num_teams = len(team_ids)
+    current_npis = np.array([opponent_npis[team_id] for team_id in team_ids], dtype=float)
+    entry_npis = game_npis(index_won, current_npis[index.opponent])
+    num_games = np.diff(index.offsets).tolist()
+    num_wins = np.bincount(index.team[index_won], minlength=num_teams).tolist()
+    num_ties = np.bincount(index.team[index_tied], minlength=num_teams).tolist()
+    offsets = index.offsets.tolist()
+
+    # Third pass: flag the used game NPIs of every team with one sort, then
+    # order them wins best first and losses worst first, grouped by team
+    used = select_used_games(index.team, index_won, entry_npis, current_npis, num_teams)
+    order = np.lexsort(
+        (np.where(index_won, -entry_npis, entry_npis), ~index_won, index.team)
+    )
+    order = order[used[order]]
+    used_offsets = [0] + np.cumsum(np.bincount(index.team[order], minlength=num_teams)).tolist()
+    used_npis_by_team = entry_npis[order].tolist()
+    # A used game counts as a qualifying win or loss by its own result, even
+    # when a win and a loss share the same game NPI
+    qualifying_wins = np.bincount(index.team[used & index_won], minlength=num_teams).tolist()
+    qualifying_losses = np.bincount(index.team[used & ~index_won], minlength=num_teams).tolist()
+
+    all_game_npis = list(zip(entry_npis.tolist(), index_won.tolist()))
+
+    for position, team_id in enumerate(team_ids):
+        if not num_games[position]:
+            continue
+
+        team_data = teams[team_id]
+        team_data["has_games"] = True
+        team_data["games"] = num_games[position]
+        team_data["wins"] = num_wins[position]
+        team_data["ties"] = num_ties[position]
+        team_data["losses"] = num_games[position] - num_wins[position] - num_ties[position]
+        team_data["all_game_npis"] = all_game_npis[offsets[position]:offsets[position + 1]]
+
+        # Calculate final NPI and stats
+        used_npis = used_npis_by_team[used_offsets[position]:used_offsets[position + 1]]
+        if used_npis:
+            team_data["game_npis"] = used_npis
+            team_data["npi"] = sum(used_npis) / len(used_npis)
+            team_data["qualifying_wins"] = qualifying_wins[position]
+            team_data["qualifying_losses"] = qualifying_losses[position]
+        else:
+            team_data["game_npis"] = []
+            team_data["npi"] = opponent_npis[team_id]
+            team_data["qualifying_wins"] = 0
+            team_data["qualifying_losses"] = 0
+
+    return teams
@@ -0,0 +1,112 @@
+"""Binary store for the NPI matrices of the simulated modes.
+
+A ``SimulationResult`` is written as ``<name>.npy``, the (teams, simulations)
+NPI matrix, next to a ``<name>.json`` sidecar with the team names, the seed
+and the convergence of every replicate. Loading memory-maps the matrix, so
+reading one team's NPIs only touches that team's row. An ``NPISummary`` is
+written as a single ``<name>.npz``; the summary of a ``SimulationResult`` goes
+to ``<name>_summary.npz``.
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+
+from .api import SimulationResult
+from .summary import NPISummary
+
+# Array attributes of NPISummary written by save_summary
+SUMMARY_ARRAYS = (
+    "edges",
+    "mean",
+    "m2",
+    "minimum",
+    "maximum",
+    "rank_counts",
+    "cutoff_counts",
+    "histogram",
+)
+
+
+def result_paths(path):
+    """``(matrix, sidecar, summary)`` paths of the result stored under ``path``."""
+    path = Path(path)
+    if path.suffix in (".npy", ".json"):
+        path = path.with_suffix("")
+    return (
+        path.with_name(f"{path.name}.npy"),
+        path.with_name(f"{path.name}.json"),
+        path.with_name(f"{path.name}_summary.npz"),
+    )
+
+
+def save_result(result, path):
+    """Write ``result`` under ``path``; returns the path of the ``.npy`` matrix."""
+    matrix_path, sidecar_path, summary_path = result_paths(path)
+    matrix_path.parent.mkdir(parents=True, exist_ok=True)
+
+    np.save(matrix_path, np.ascontiguousarray(result.npis, dtype=float))
+    sidecar = {
+        "teams": list(result.teams),
+        "seed": int(result.seed),
+        "convergence": [
+            {"iterations": int(c["iterations"]), "residual": float(c["residual"])}
+            for c in result.convergence
+        ],
+    }
+    sidecar_path.write_text(json.dumps(sidecar))
+    if result.summary is not None:
+        save_summary(result.summary, summary_path)
+    return matrix_path
+
+
+def load_result(path, mmap_mode="r"):
+    """Read a result written by ``save_result``.
+
+    The NPI matrix is memory-mapped unless ``mmap_mode`` is None.
+    """
+    matrix_path, sidecar_path, summary_path = result_paths(path)
+    sidecar = json.loads(sidecar_path.read_text())
+    npis = np.load(matrix_path, mmap_mode=mmap_mode)
+    summary = load_summary(summary_path) if summary_path.exists() else None
+    return SimulationResult(
+        sidecar["teams"], npis, sidecar["convergence"], sidecar["seed"], summary
+    )
+
+
+def save_summary(summary, path):
+    """Write ``summary`` to ``<path>.npz``; returns the written path."""
+    path = Path(path).with_suffix(".npz")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    low, high = summary.iterations
+    np.savez(
+        path,
+        teams=np.array(summary.teams, dtype=str),
+        # Seeds may exceed 64 bits, so they are kept as text
+        seed=np.array("" if summary.seed is None else str(summary.seed)),
+        count=np.array(summary.count),
+        cutoffs=np.array(summary.cutoffs, dtype=np.int64),
+        iterations=np.array([-1 if low is None else low, -1 if high is None else high]),
+        max_residual=np.array(summary.max_residual),
+        **{name: getattr(summary, name) for name in SUMMARY_ARRAYS},
+    )
+    return path
+
+
+def load_summary(path):
+    """Read an ``NPISummary`` written by ``save_summary``."""
+    with np.load(Path(path).with_suffix(".npz"), allow_pickle=False) as arrays:
+        seed = str(arrays["seed"])
+        summary = NPISummary(
+            arrays["teams"].tolist(),
+            int(seed) if seed else None,
+            arrays["edges"],
+            arrays["cutoffs"].tolist(),
+        )
+        for name in SUMMARY_ARRAYS:
+            setattr(summary, name, arrays[name])
+        summary.count = int(arrays["count"])
+        low, high = arrays["iterations"].tolist()
+        summary.iterations = (None, None) if low < 0 else (low, high)
+        summary.max_residual = float(arrays["max_residual"])
+    return summary
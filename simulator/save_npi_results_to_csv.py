@@ -2,10 +2,9 @@ import csv
 from pathlib import Path
 
 
-def save_npi_results_to_csv(teams):
-    """Write results for an iteration to CSV."""
-    data_path = Path(__file__).parent / "data" / "processed_result.csv"
-
+def save_npi_results_to_csv(teams, data_path):
+    """Write results for an iteration to CSV at ``data_path``."""
+    data_path = Path(data_path)
     data_path.parent.mkdir(parents=True, exist_ok=True)
 
     old_rankings = {}
@@ -0,0 +1,211 @@
+import pandas as pd
+import numpy as np
+
+def fix_game_number(schedule):
+    df = schedule.copy()
+    # Within each (date, team, opponent) group, assign 1,2,3… in the original row‐order:
+    df['game_number'] = df.groupby(
+        ['date','team','opponent'], 
+        sort=False
+    ).cumcount().add(1)
+    return df
+
+#Schedule
+#Formatted schedule without CMU as panda df
+
+#Date
+#List of dates of ordered play game with length num_games. Dates should be formatted as "MM/DD/YYYY", there can be duplicate
+
+#num_games 
+# total number of games to be played
+
+#elo_table
+#formatted elo table
+
+
+#strategy terms:
+# 0 = random or anything else
+# 1 = 50% top 1/3 teams, random for the rest
+# 2 = 50% middle 1/3 teams, random for the rest
+# 3 = 50% list 1/3 teams, random for the rest
+
+#rng
+#numpy Generator used for every random pick, a fresh one when None
+
+def generate_schedule(schedule, elo_table, dates, num_games, strategy, rng=None):
+    rng = np.random.default_rng() if rng is None else rng
+
+    if len(dates) != num_games:
+        raise ValueError(f"Numebr of games should be the same as length of the date list.")
+
+    UAA = ["CWRU", "Brandeis", "Carnegie Mellon", "Emory", "NYU", "UChicago", "Rochester (NY)", "WashU"]
+    in_region = ["CWRU", "Hope", "Carnegie Mellon", "Marietta", "Calvin", "Otterbein", "Ohio Northern"]
+    in_region_count = num_games*0.7
+    home = "Carnegie Mellon"
+    elo_sorted = elo_table.sort_values(by="elo_rating", ascending=True).reset_index(drop=True)
+    bottom, middle, top = (elo_sorted.iloc[rows] for rows in np.array_split(np.arange(len(elo_sorted)), 3))
+
+    #tier the non-region games are drawn from; random for any other strategy
+    pool = {1: top, 2: middle, 3: bottom}.get(strategy, elo_table)
+
+    #fulfill in region requirement first (games i < in_region_count), then the tier
+    num_in_region = min(num_games, int(np.ceil(in_region_count)))
+    away = np.concatenate([
+        rng.choice(in_region, size=num_in_region),
+        rng.choice(pool['team'].to_numpy(), size=num_games - num_in_region),
+    ])
+
+    return _append_games(schedule, dates, home, away)
+
+
+#same as above but ignoring any in region requirement
+def generate_schedule_random(schedule, elo_table, dates, num_games, rng=None):
+        rng = np.random.default_rng() if rng is None else rng
+        away = rng.choice(elo_table['team'].to_numpy(), size=num_games)
+        return _append_games(schedule, dates, "Carnegie Mellon", away)
+
+
+#append all generated games in one concat, fix gamenumber, sort and return
+def _append_games(schedule, dates, home, away):
+    games = pd.DataFrame({"date": list(dates), "team": home, "opponent": away, "game_number": 1})
+    schedule = pd.concat([schedule, games], ignore_index=True)
+    schedule = fix_game_number(schedule)
+    schedule = schedule.sort_values(by = "date")
+    return schedule
+
+
+
+#fill the rows in the schedule lacking an opponent, returns a new date sorted schedule
+def fill_schedule(schedule, elo_table, rng=None):
+    rng = np.random.default_rng() if rng is None else rng
+    schedule = schedule.copy()
+    #find games without opponent and draw all their opponents at once
+    missing = _missing_opponent(schedule)
+    if missing.any():
+        schedule.loc[missing, 'opponent'] = rng.choice(
+            elo_table['team'].to_numpy(), size=int(missing.sum())
+        )
+    return _sort_schedule(schedule)
+
+
+def _sort_schedule(schedule):
+    # STEP 1: parse the date column
+    schedule['date'] = pd.to_datetime(schedule['date'], format="%m/%d/%Y", errors='coerce')
+
+    # STEP 2: sort by date _and_ game_number
+    # If your fix_game_number recomputes game_number correctly,
+    # call it first; otherwise you can sort, then recalc game_number.
+    schedule = fix_game_number(schedule)
+    schedule = schedule.sort_values(['date', 'game_number']).reset_index(drop=True)
+
+    schedule['date'] = schedule['date'].dt.strftime("%m/%d/%Y")
+
+    return schedule
+
+
+def _missing_opponent(schedule):
+    return schedule['opponent'].isna() | (schedule['opponent'] == "")
+
+
+class SeasonTemplate:
+    """A season parsed and sorted once, to be filled many times.
+
+    The rows with an opponent are date parsed, numbered and sorted up front.
+    ``fill`` draws the missing opponents like ``fill_schedule`` and slots the
+    filled rows into that order by binary search, so preparing a schedule
+    neither re-parses the dates nor re-sorts the season.
+    """
+
+    def __init__(self, schedule):
+        self.schedule = schedule
+        self._missing = _missing_opponent(schedule).to_numpy()
+        listed = ~self._missing
+        dates = pd.to_datetime(schedule['date'], format="%m/%d/%Y", errors='coerce')
+        parsed = dates.notna().to_numpy()
+        days = dates.to_numpy(dtype='datetime64[D]').astype(np.int64)
+        #unparsable dates sort after every real day, as pandas puts NaT last
+        self._no_day = days[parsed].max() + 1 if parsed.any() else 0
+        days = np.where(parsed, days, self._no_day)
+        rows = np.arange(len(schedule))
+
+        base = schedule.loc[listed].copy()
+        base['date'] = dates[listed]
+        base = fix_game_number(base)
+        #game numbers stay below the stride; NaN ones sort last
+        self._stride = len(schedule) + 2
+        game_number = base['game_number'].fillna(self._stride - 1).to_numpy(dtype=np.int64)
+        keys = _sort_keys(days[listed], game_number, rows[listed], self._stride)
+        order = np.argsort(keys, kind='stable')
+        self._keys = keys[order]
+        base = base.iloc[order].reset_index(drop=True)
+        base['date'] = base['date'].dt.strftime("%m/%d/%Y")
+        self.base = base
+
+        #original rows of every (day, team, opponent) group in row order,
+        #to number the filled rows
+        self._groups = {}
+        for day, team, opponent, row in zip(
+            days[listed].tolist(),
+            schedule['team'][listed].tolist(),
+            schedule['opponent'][listed].tolist(),
+            rows[listed].tolist(),
+        ):
+            self._groups.setdefault((day, team, opponent), []).append(row)
+
+        self.missing = schedule.loc[self._missing].reset_index(drop=True)
+        self._missing_rows = rows[self._missing]
+        self._missing_days = days[self._missing]
+        self._missing_dates = dates[self._missing].dt.strftime("%m/%d/%Y").to_numpy()
+
+    def fill(self, elo_table, rng=None):
+        """Same schedule as ``fill_schedule(self.schedule, elo_table, rng)``."""
+        rng = np.random.default_rng() if rng is None else rng
+        if not len(self.missing):
+            return self.base.copy()
+
+        opponents = rng.choice(elo_table['team'].to_numpy(), size=len(self.missing))
+        game_number = self._number(opponents)
+        if game_number is None:
+            #a filled game renumbers a listed game, so take the full path
+            schedule = self.schedule.copy()
+            schedule.loc[self._missing, 'opponent'] = opponents
+            return _sort_schedule(schedule)
+
+        filled = self.missing.assign(
+            date=self._missing_dates, opponent=opponents, game_number=game_number
+        )
+        keys = _sort_keys(self._missing_days, game_number, self._missing_rows, self._stride)
+        order = np.argsort(keys, kind='stable')
+        positions = np.searchsorted(self._keys, keys[order])
+        #row of base + filled placed at each position of the schedule
+        rows = np.insert(np.arange(len(self.base)), positions, len(self.base) + order)
+        schedule = pd.concat([self.base, filled], ignore_index=True)
+        return schedule.take(rows).reset_index(drop=True)
+
+    def _number(self, opponents):
+        #game_number of each filled row, None when a listed game of the same
+        #day and pairing comes after it and would be renumbered
+        seen = {}
+        game_number = np.empty(len(opponents), dtype=np.int64)
+        for position, (day, team, opponent, row) in enumerate(
+            zip(
+                self._missing_days.tolist(),
+                self.missing['team'].tolist(),
+                opponents.tolist(),
+                self._missing_rows.tolist(),
+            )
+        ):
+            if day == self._no_day or pd.isna(team):
+                return None
+            key = (day, team, opponent)
+            listed = self._groups.get(key, ())
+            if listed and listed[-1] > row:
+                return None
+            seen[key] = seen.get(key, 0) + 1
+            game_number[position] = len(listed) + seen[key]
+        return game_number
+
+
+def _sort_keys(days, game_number, rows, stride):
+    #one integer per row ordering by date, then game_number, then row
+    return (days.astype(np.int64) * stride + game_number) * stride + rows
@@ -0,0 +1,103 @@
+"""On-disk cache of compiled seasons keyed by the content of their CSVs.
+
+Runs against the same reference season and Elo table load the compiled
+``SeasonTable`` and the Elo table from one ``.npz`` file instead of parsing
+and compiling the CSVs again.
+"""
+import hashlib
+import os
+from dataclasses import fields
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from .parallel import schedule_teams
+from .season_table import SeasonTable, compile_season
+
+CACHE_DIR = Path(__file__).resolve().parent / "data" / "cache"
+
+# Bump when the layout of SeasonTable or of the cache file changes
+CACHE_VERSION = 1
+
+
+def content_key(*parts):
+    """Hex SHA-256 digest of the given byte strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(hashlib.sha256(part).digest())
+    return digest.hexdigest()
+
+
+def save_compiled(path, season, elo_table):
+    """Write ``season`` and ``elo_table`` to ``path`` as an uncompressed ``.npz``.
+
+    The file is written next to ``path`` first and then moved in place, so
+    concurrent readers never see a partial file.
+    """
+    arrays = {
+        field.name: np.asarray(getattr(season, field.name))
+        for field in fields(SeasonTable)
+    }
+    arrays["teams"] = np.array(season.teams, dtype=str)
+    arrays["elo_columns"] = np.array(elo_table.columns, dtype=str)
+    for position, column in enumerate(elo_table.columns):
+        values = elo_table[column].to_numpy()
+        arrays[f"elo_{position}"] = values.astype(str) if values.dtype == object else values
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+    np.savez(partial, **arrays)
+    os.replace(partial, path)
+
+
+def load_compiled(path):
+    """Read the ``(season, elo_table)`` pair written by ``save_compiled``."""
+    with np.load(path, allow_pickle=False) as arrays:
+        season = SeasonTable(
+            **{field.name: arrays[field.name] for field in fields(SeasonTable)}
+        )
+        season.teams = season.teams.tolist()
+        elo_columns = arrays["elo_columns"].tolist()
+        elo_table = pd.DataFrame(
+            {
+                column: arrays[f"elo_{position}"]
+                for position, column in enumerate(elo_columns)
+            }
+        )
+    for column in elo_table.columns:
+        if elo_table[column].dtype.kind == "U":
+            elo_table[column] = elo_table[column].astype(object)
+    return season, elo_table
+
+
+def cached_season(season_path, elo_path, sample_known_results=True, cache_dir=CACHE_DIR):
+    """Compiled ``SeasonTable`` and Elo table of two CSV files.
+
+    The cache key covers the bytes of both files and the compile options,
+    so an edited CSV is compiled again. ``cache_dir=None`` disables the
+    cache. Returns ``(season, elo_table)``.
+    """
+    if cache_dir is not None:
+        key = content_key(
+            Path(season_path).read_bytes(),
+            Path(elo_path).read_bytes(),
+            f"{CACHE_VERSION}:{sample_known_results}".encode(),
+        )
+        path = Path(cache_dir) / f"season_{key[:32]}.npz"
+        if path.exists():
+            try:
+                return load_compiled(path)
+            except (OSError, ValueError, KeyError):
+                # Unreadable cache file; compile again and overwrite it
+                pass
+
+    schedule = pd.read_csv(season_path)
+    elo_table = pd.read_csv(elo_path)
+    season = compile_season(
+        schedule, elo_table, schedule_teams(schedule), sample_known_results
+    )
+
+    if cache_dir is not None:
+        save_compiled(path, season, elo_table)
+    return season, elo_table
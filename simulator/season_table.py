@@ -0,0 +1,173 @@
+"""Precompiled, integer-coded form of a schedule shared by all its replicates.
+
+The schedule is parsed once: Elo rows of both teams, the rows counted as NPI
+games and their per-side entries do not depend on the simulated outcomes, so
+a replicate only has to draw the outcome bits of its simulated rows.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .backends import DEFAULT_BACKEND, check_backend
+from .elo_engine import build_team_index, encode_games, replay_elo, replay_elo_batch
+from .load_games import load_game_arrays
+from .npi_solver import MAX_ITERATIONS, index_game_arrays, warm_start
+
+
+@dataclass
+class SeasonTable:
+    """Static part of a schedule, in schedule row order unless noted.
+
+    ``simulated`` flags the rows whose outcome is drawn in every replicate;
+    the other rows keep ``home_won``/``away_won``. ``game_rows`` are the
+    rows counted as NPI games and ``team``/``opponent`` their per-side
+    entries over ``teams``.
+    """
+
+    teams: list
+    ratings: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+    simulated: np.ndarray
+    home_won: np.ndarray
+    away_won: np.ndarray
+    game_rows: np.ndarray
+    team: np.ndarray
+    opponent: np.ndarray
+
+    def simulate(self, draws, scaling_factor=400, update_factor=20, backend=DEFAULT_BACKEND):
+        """Replay the schedule once per row of ``draws``.
+
+        ``draws`` is a (sims, simulated rows) matrix of uniform draws. Known
+        rows update Elo with their result instead of being sampled. The
+        ``"numpy"`` backend replays all rows of ``draws`` at once, the
+        ``"python"`` one each row on its own with ``replay_elo``. Returns
+        (sims, rows) ``home_won`` and ``away_won`` outcome matrices.
+        """
+        num_sims = len(draws)
+        home_won = np.tile(self.home_won, (num_sims, 1))
+        away_won = np.tile(self.away_won, (num_sims, 1))
+
+        simulated_rows = np.flatnonzero(self.simulated)
+        if not len(simulated_rows):
+            return home_won, away_won
+
+        if check_backend(backend) == "python":
+            for sim in range(num_sims):
+                home_won[sim] = replay_elo(
+                    self.ratings.copy(),
+                    self.home,
+                    self.away,
+                    draws[sim],
+                    scaling_factor,
+                    update_factor,
+                    simulated=self.simulated,
+                    known_home_won=self.home_won,
+                )
+            away_won[:, simulated_rows] = ~home_won[:, simulated_rows]
+            return home_won, away_won
+
+        # Rows before the first simulated row play out the same in every
+        # replicate, and rows after the last one cannot change any draw
+        first, stop = simulated_rows[0], simulated_rows[-1] + 1
+        ratings = self.ratings[np.newaxis].copy()
+        replay_elo_batch(
+            ratings,
+            self.home[:first],
+            self.away[:first],
+            np.empty((1, 0)),
+            scaling_factor,
+            update_factor,
+            simulated=self.simulated[:first],
+            known_home_won=self.home_won[:first],
+        )
+
+        home_won[:, first:stop] = replay_elo_batch(
+            np.tile(ratings, (num_sims, 1)),
+            self.home[first:stop],
+            self.away[first:stop],
+            draws,
+            scaling_factor,
+            update_factor,
+            simulated=self.simulated[first:stop],
+            known_home_won=self.home_won[first:stop],
+        )
+        away_won[:, simulated_rows] = ~home_won[:, simulated_rows]
+        return home_won, away_won
+
+    def side_won(self, home_won, away_won, out=None):
+        """Per-side ``won`` entries of one replicate's outcome rows.
+
+        ``out`` may be a buffer reused across replicates.
+        """
+        if out is None:
+            out = np.empty(len(self.team), dtype=bool)
+        out[0::2] = home_won[self.game_rows]
+        out[1::2] = away_won[self.game_rows]
+        return out
+
+    def warm_start(self, max_iterations=MAX_ITERATIONS, tolerance=None, backend=DEFAULT_BACKEND):
+        """``WarmStart`` of the season as recorded, for its replicates' NPI solves.
+
+        Rows with a result keep it and the others go to the team rated
+        higher at the start of the season.
+        """
+        decided = self.home_won | self.away_won
+        favourite = self.ratings[self.home] >= self.ratings[self.away]
+        won = self.side_won(
+            np.where(decided, self.home_won, favourite),
+            np.where(decided, self.away_won, ~favourite),
+        )
+        return warm_start(
+            self.team, self.opponent, won, len(self.teams), max_iterations, tolerance, backend
+        )
+
+
+def compile_season(schedule, elo_table, teams, sample_known_results=True):
+    """Parse ``schedule`` into a ``SeasonTable``.
+
+    By default every row is simulated, as ``predict_result`` re-samples the
+    whole season. With ``sample_known_results=False`` only the rows lacking
+    a result (missing or 0-0 scores) are simulated and the others keep
+    their real outcome. ``teams`` fixes the NPI team order.
+    """
+    home, away = encode_games(schedule, build_team_index(elo_table))
+    num_rows = len(schedule)
+
+    home_score = pd.to_numeric(schedule["home_score"], errors="coerce").to_numpy(dtype=float)
+    away_score = pd.to_numeric(schedule["away_score"], errors="coerce").to_numpy(dtype=float)
+    if sample_known_results:
+        simulated = np.ones(num_rows, dtype=bool)
+    else:
+        simulated = ~(
+            np.isfinite(home_score)
+            & np.isfinite(away_score)
+            & ((home_score != 0) | (away_score != 0))
+        )
+
+    # Simulated rows always end 1-0 or 0-1, so a placeholder score is enough
+    # to tell which rows the loader keeps
+    games, _ = load_game_arrays(
+        schedule.assign(
+            home_score=np.where(simulated, 1, home_score),
+            away_score=np.where(simulated, 0, away_score),
+        ),
+        {team: position for position, team in enumerate(teams)},
+    )
+    team, opponent, _, _ = index_game_arrays(
+        games["team1"], games["team2"], games["team1_score"], games["team2_score"]
+    )
+
+    return SeasonTable(
+        teams=teams,
+        ratings=elo_table["elo_rating"].to_numpy(dtype=float, copy=True),
+        home=home,
+        away=away,
+        simulated=simulated,
+        home_won=home_score > away_score,
+        away_won=away_score > home_score,
+        game_rows=games["row"],
+        team=team,
+        opponent=opponent,
+    )
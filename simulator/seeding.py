@@ -0,0 +1,38 @@
+"""Reproducible random streams for every stochastic step of a run.
+
+A run is identified by a single integer seed. Each schedule and each Elo
+replicate derives its own independent ``numpy.random.Generator`` from that
+seed and its position, so any replicate can be re-run on its own. A
+replicate draws one uniform per simulated row of its schedule's compiled
+``SeasonTable``, so with ``table`` that table
+
+    draws = replicate_rng(seed, 0, 41).random(int(table.simulated.sum()))
+    table.simulate(draws[np.newaxis], 400, 133)
+
+reproduces the outcomes of simulation 41 of the first schedule, whether
+every row is simulated or only those lacking a result.
+"""
+import numpy as np
+
+# First element of the spawn key, keeping the two kinds of streams apart
+SCHEDULE_STREAM = 0
+REPLICATE_STREAM = 1
+
+
+def resolve_seed(seed=None):
+    """Return ``seed``, or fresh OS entropy when it is None, so the run can be repeated."""
+    return np.random.SeedSequence(seed).entropy
+
+
+def schedule_rng(seed, schedule_index):
+    """Generator used to build schedule ``schedule_index``."""
+    return np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=(SCHEDULE_STREAM, schedule_index))
+    )
+
+
+def replicate_rng(seed, schedule_index, sim_index):
+    """Generator used for Elo simulation ``sim_index`` of schedule ``schedule_index``."""
+    return np.random.default_rng(
+        np.random.SeedSequence(seed, spawn_key=(REPLICATE_STREAM, schedule_index, sim_index))
+    )
@@ -0,0 +1,135 @@
+"""Streaming per-team summaries of NPI replicates.
+
+``NPISummary`` folds replicates in one at a time, so its memory depends on
+the number of teams only and not on the number of simulations.
+"""
+import numpy as np
+import pandas as pd
+
+# Fixed histogram bins; NPIs outside them are counted in the edge bins
+HISTOGRAM_EDGES = np.linspace(0.0, 100.0, 101)
+
+# NPI-rank cutoffs whose probabilities are reported, e.g. at-large bids
+CUTOFFS = (19, 64)
+
+
+class NPISummary:
+    """Running statistics of the NPIs of one schedule's replicates.
+
+    Keeps per-team mean and variance (Welford), min and max, how often each
+    team finishes at each of the top ``rank_depth`` NPI ranks and within
+    each of ``cutoffs``, and a fixed-bin histogram, plus the range of NPI
+    iterations and the largest residual. ``rank_depth`` defaults to every
+    rank, the full teams x teams distribution; a smaller depth is raised to
+    the largest cutoff.
+    """
+
+    def __init__(self, teams, seed=None, edges=HISTOGRAM_EDGES, cutoffs=CUTOFFS, rank_depth=None):
+        num_teams = len(teams)
+        self.teams = list(teams)
+        self.seed = seed
+        self.edges = np.asarray(edges, dtype=float)
+        self.cutoffs = tuple(int(cutoff) for cutoff in cutoffs)
+        # The rank distribution always reaches the largest cutoff
+        if rank_depth is None:
+            rank_depth = num_teams
+        rank_depth = min(max(rank_depth, *self.cutoffs, 0), num_teams)
+        self.count = 0
+        self.mean = np.zeros(num_teams)
+        self.m2 = np.zeros(num_teams)
+        self.minimum = np.full(num_teams, np.inf)
+        self.maximum = np.full(num_teams, -np.inf)
+        # rank_counts[team, r] counts the replicates where the team ranked r + 1
+        self.rank_counts = np.zeros((num_teams, rank_depth), dtype=np.int64)
+        # cutoff_counts[team, c] counts the replicates where it made cutoffs[c]
+        self.cutoff_counts = np.zeros((num_teams, len(self.cutoffs)), dtype=np.int64)
+        self.histogram = np.zeros((num_teams, len(self.edges) - 1), dtype=np.int64)
+        self.iterations = (None, None)
+        self.max_residual = 0.0
+
+    def update(self, npis, convergence=None):
+        """Fold in the NPIs of one replicate, in ``teams`` order."""
+        npis = np.asarray(npis, dtype=float)
+        rows = np.arange(len(npis))
+
+        self.count += 1
+        delta = npis - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (npis - self.mean)
+        np.minimum(self.minimum, npis, out=self.minimum)
+        np.maximum(self.maximum, npis, out=self.maximum)
+
+        # Partial sort: only the top rank_depth teams are ordered, highest
+        # NPI first with ties in team order
+        depth = self.rank_counts.shape[1]
+        top = rows
+        if depth < len(npis):
+            # Keep every team tied with the depth-th NPI so the order below,
+            # not the partition, decides which of them make the cut
+            boundary = np.partition(-npis, depth - 1)[depth - 1] if depth else -np.inf
+            top = np.flatnonzero(-npis <= boundary)
+        top = top[np.lexsort((top, -npis[top]))][:depth]
+        self.rank_counts[top, rows[:depth]] += 1
+        for column, cutoff in enumerate(self.cutoffs):
+            self.cutoff_counts[top[:cutoff], column] += 1
+
+        bins = np.searchsorted(self.edges, npis, side="right") - 1
+        self.histogram[rows, np.clip(bins, 0, self.histogram.shape[1] - 1)] += 1
+
+        if convergence is not None:
+            low, high = self.iterations
+            iterations = convergence["iterations"]
+            self.iterations = (
+                iterations if low is None else min(low, iterations),
+                iterations if high is None else max(high, iterations),
+            )
+            self.max_residual = max(self.max_residual, convergence["residual"])
+
+    @property
+    def variance(self):
+        """Sample variance of every team's NPI; NaN below two replicates."""
+        if self.count < 2:
+            return np.full(len(self.teams), np.nan)
+        return self.m2 / (self.count - 1)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def cutoff_probabilities(self):
+        """Probability of every team finishing within each cutoff, one column per cutoff."""
+        frame = pd.DataFrame(
+            self.cutoff_counts / max(self.count, 1),
+            columns=[f"p_top_{cutoff}" for cutoff in self.cutoffs],
+        )
+        frame.insert(0, "team", self.teams)
+        return frame
+
+    def rank_probabilities(self, team):
+        """Probability of ``team`` finishing at ranks 1 to ``rank_depth``."""
+        if team not in self.teams:
+            return np.zeros(self.rank_counts.shape[1])
+        return self.rank_counts[self.teams.index(team)] / max(self.count, 1)
+
+    def team_histogram(self, team):
+        """``(counts, edges)`` of ``team``'s NPIs, empty if it is not scheduled."""
+        if team not in self.teams:
+            return np.zeros(len(self.edges) - 1, dtype=np.int64), self.edges
+        return self.histogram[self.teams.index(team)], self.edges
+
+    def to_frame(self):
+        """One row per team with its NPI statistics and cutoff probabilities.
+
+        Ordered by mean NPI, best first.
+        """
+        frame = pd.DataFrame(
+            {
+                "team": self.teams,
+                "mean": self.mean,
+                "std": self.std,
+                "min": self.minimum,
+                "max": self.maximum,
+            }
+        )
+        frame = frame.join(self.cutoff_probabilities().drop(columns="team"))
+        return frame.sort_values("mean", ascending=False, ignore_index=True)
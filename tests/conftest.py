@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from simulator.benchmark import BenchmarkConfig, synthetic_elo_table, synthetic_season
+
+
+@pytest.fixture
+def elo_table():
+    return synthetic_elo_table(BenchmarkConfig(teams=40, seed=7))
+
+
+@pytest.fixture
+def season(elo_table):
+    return synthetic_season(BenchmarkConfig(teams=40, games_per_team=12, seed=7), elo_table)
@@ -0,0 +1,140 @@
+import numpy as np
+import pytest
+
+from simulator import run_no_result
+from simulator.calculate_game_npi import calculate_game_npi
+from simulator.calculate_owp import game_index
+from simulator.load_games import load_games
+from simulator.load_teams import load_teams
+from simulator.npi_solver import solve_npi
+from simulator.parallel import schedule_teams
+from simulator.process_games_iteration import process_games_iteration
+from simulator.season_table import compile_season
+
+
+def baseline_iteration(games, valid_teams, opponent_npis):
+    """One pass of the per-game and per-team loops of the original solver.
+
+    Copied from ``process_games_iteration`` as it was before it moved onto
+    the game index, keeping only what the NPI and qualifying counts need.
+    """
+    all_game_npis = {team_id: [] for team_id in valid_teams}
+    for game in games:
+        team1_id = game["team1_id"]
+        team2_id = game["team2_id"]
+        team1_score = game["team1_score"]
+        team2_score = game["team2_score"]
+
+        if (
+            team1_id not in valid_teams
+            or team2_id not in valid_teams
+            or (team1_score == 0 and team2_score == 0)
+        ):
+            continue
+
+        team1_won = team1_score > team2_score
+        team2_won = team2_score > team1_score
+        all_game_npis[team1_id].append(
+            (calculate_game_npi(team1_won, opponent_npis[team2_id]), team1_won)
+        )
+        all_game_npis[team2_id].append(
+            (calculate_game_npi(team2_won, opponent_npis[team1_id]), team2_won)
+        )
+
+    teams = {}
+    for team_id, all_games in all_game_npis.items():
+        initial_npi = opponent_npis[team_id]
+        teams[team_id] = {"npi": initial_npi, "qualifying_wins": 0, "qualifying_losses": 0}
+        if not all_games:
+            continue
+
+        wins = sorted((npi for npi, won in all_games if won), reverse=True)
+        losses = sorted(npi for npi, won in all_games if not won)
+
+        used_npis = [
+            win_npi for i, win_npi in enumerate(wins) if i < 10 or win_npi >= initial_npi
+        ]
+        if losses:
+            worst_loss = losses[0]
+            used_npis.extend(npi for npi in losses if npi == worst_loss)
+            seen_npis = {worst_loss}
+            for loss_npi in losses:
+                if loss_npi < initial_npi and loss_npi not in seen_npis:
+                    seen_npis.add(loss_npi)
+                    used_npis.extend(npi for npi in losses if npi == loss_npi)
+
+        if used_npis:
+            teams[team_id] = {
+                "npi": sum(used_npis) / len(used_npis),
+                "qualifying_wins": sum(1 for npi in used_npis if npi in wins),
+                "qualifying_losses": sum(1 for npi in used_npis if npi in losses),
+            }
+    return teams
+
+
+@pytest.fixture
+def baseline(season):
+    """Games of ``season`` and the original solver's result after 30 passes.
+
+    The synthetic season has no win and loss sharing a game NPI, so the
+    original qualifying counts apply unchanged.
+    """
+    valid_teams = load_teams(season)
+    games, _ = load_games(season, valid_teams)
+
+    npis = {team_id: 50 for team_id in valid_teams}
+    for _ in range(30):
+        reference = baseline_iteration(games, valid_teams, npis)
+        npis = {team_id: team["npi"] for team_id, team in reference.items()}
+    return games, valid_teams, reference
+
+
+def assert_matches_baseline(teams, reference):
+    for team_id, team in reference.items():
+        assert teams[team_id]["npi"] == pytest.approx(team["npi"], abs=1e-12)
+        assert teams[team_id]["qualifying_wins"] == team["qualifying_wins"]
+        assert teams[team_id]["qualifying_losses"] == team["qualifying_losses"]
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_solve_npi_matches_baseline(baseline, backend):
+    games, valid_teams, reference = baseline
+
+    teams, convergence = solve_npi(games, valid_teams, 30, None, backend)
+
+    assert convergence["iterations"] == 30
+    assert_matches_baseline(teams, reference)
+
+
+def test_process_games_iteration_matches_baseline(baseline):
+    games, valid_teams, reference = baseline
+    index = game_index(games, valid_teams)
+
+    previous = None
+    for iteration in range(1, 31):
+        teams = process_games_iteration(games, valid_teams, previous, iteration, index)
+        previous = {team_id: team["npi"] for team_id, team in teams.items()}
+
+    assert_matches_baseline(teams, reference)
+
+
+@pytest.mark.parametrize("sample_known_results", [True, False])
+def test_season_table_simulate_backends_agree(season, elo_table, sample_known_results):
+    season = season.copy()
+    season.loc[season.index[-10:], ["home_score", "away_score"]] = 0
+    table = compile_season(season, elo_table, schedule_teams(season), sample_known_results)
+    draws = np.random.default_rng(3).random((5, int(table.simulated.sum())))
+
+    numpy_won = table.simulate(draws, 400, 133, backend="numpy")
+    python_won = table.simulate(draws, 400, 133, backend="python")
+
+    np.testing.assert_array_equal(numpy_won[0], python_won[0])
+    np.testing.assert_array_equal(numpy_won[1], python_won[1])
+
+
+def test_results_do_not_depend_on_workers(season, elo_table):
+    single = run_no_result(season, 12, elo_table=elo_table, workers=1, seed=11)
+    pooled = run_no_result(season, 12, elo_table=elo_table, workers=2, seed=11)
+
+    assert single.teams == pooled.teams
+    np.testing.assert_allclose(single.npis, pooled.npis, rtol=0, atol=1e-12)
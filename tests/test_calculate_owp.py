@@ -0,0 +1,30 @@
+from simulator.calculate_owp import calculate_owp
+from simulator.load_games import load_games
+from simulator.load_teams import load_teams
+from simulator.process_games_iteration import process_games_iteration
+
+
+def test_owp_follows_edited_scores(season):
+    valid_teams = load_teams(season)
+    games, _ = load_games(season, valid_teams)
+    before = calculate_owp(games, valid_teams)
+
+    game = games[0]
+    game["team1_score"], game["team2_score"] = game["team2_score"], game["team1_score"]
+    after = calculate_owp(games, valid_teams)
+
+    changed = [team_id for team_id in valid_teams if after[team_id] != before[team_id]]
+    assert changed
+    assert after == calculate_owp(list(games), dict(valid_teams))
+
+
+def test_process_games_iteration_follows_edited_scores(season):
+    valid_teams = load_teams(season)
+    games, _ = load_games(season, valid_teams)
+    before = process_games_iteration(games, valid_teams)
+
+    game = games[0]
+    game["team1_score"], game["team2_score"] = game["team2_score"], game["team1_score"]
+    after = process_games_iteration(games, valid_teams)
+
+    assert after[game["team1_id"]]["wins"] != before[game["team1_id"]]["wins"]
@@ -0,0 +1,11 @@
+import numpy as np
+import pandas as pd
+
+from simulator.elo_simulation import predict_result
+
+
+def test_predict_result_is_reproducible_from_a_seed(season, elo_table):
+    first = predict_result(elo_table.copy(), season, rng=np.random.default_rng(5))
+    second = predict_result(elo_table.copy(), season, rng=np.random.default_rng(5))
+
+    pd.testing.assert_frame_equal(first, second)
@@ -0,0 +1,23 @@
+import pandas as pd
+
+from simulator.load_games import load_games
+
+
+def test_non_integer_text_is_unparsable():
+    season = pd.DataFrame(
+        {
+            "date": ["08/30/2024"] * 4,
+            "team": ["A", "A", "A", "A"],
+            "opponent": ["B", "C", "D", "E"],
+            "home_score": [" 3 ", "3", "2.7", "3"],
+            "away_score": ["1", "1", "3", "0"],
+            "game_number": ["1", "1.0", "1", "+1"],
+        }
+    )
+    valid_teams = {team: team for team in "ABCDE"}
+
+    games, stats = load_games(season, valid_teams)
+
+    assert [game["team2_id"] for game in games] == ["B", "E"]
+    assert games[0]["team1_score"] == 3
+    assert stats["unparsable"] == 2
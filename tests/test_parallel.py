@@ -0,0 +1,18 @@
+import argparse
+
+import pytest
+
+from simulator import run_no_result
+from simulator.parallel import parse_count
+
+
+def test_run_rejects_zero_simulations(season, elo_table):
+    with pytest.raises(ValueError):
+        run_no_result(season, 0, elo_table=elo_table, workers=2, seed=1)
+
+
+def test_parse_count_rejects_counts_below_one():
+    assert parse_count("3") == 3
+    for text in ("0", "-2"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_count(text)
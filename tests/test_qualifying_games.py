@@ -0,0 +1,59 @@
+import pytest
+
+from simulator.npi_solver import solve_npi
+from simulator.process_games_iteration import process_games_iteration
+
+
+def win(winner, loser):
+    return {
+        "date": None,
+        "team1_id": winner,
+        "team2_id": loser,
+        "team1_score": 3,
+        "team2_score": 1,
+    }
+
+
+@pytest.fixture
+def shared_npi_games():
+    """Season where T's win over A and loss to B both score 47.2 on the third pass.
+
+    T goes 1-7, so A's only game, a loss to T, scores 34 on the second pass.
+    B beats T and H, whose 3-1 record puts B at 59 = 34 + 25, which makes a
+    loss to B worth exactly as much as a win over A.
+    """
+    games = [win("T", "A"), win("B", "T"), win("B", "H")]
+    games += [win(f"D{position}", "T") for position in range(6)]
+    games += [win("H", f"E{position}") for position in range(3)]
+    valid_teams = {
+        team_id: team_id for game in games for team_id in (game["team1_id"], game["team2_id"])
+    }
+    return games, valid_teams
+
+
+def assert_counted_by_result(team):
+    win_npi, loss_npi = (npi for npi, _ in team["all_game_npis"][:2])
+    assert win_npi == loss_npi
+    assert team["game_npis"].count(win_npi) == 2
+    assert team["qualifying_wins"] == 1
+    assert team["qualifying_losses"] == 7
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_solve_npi_counts_shared_npi_once_per_result(shared_npi_games, backend):
+    games, valid_teams = shared_npi_games
+
+    teams, _ = solve_npi(games, valid_teams, 3, None, backend)
+
+    assert_counted_by_result(teams["T"])
+
+
+def test_process_games_iteration_counts_shared_npi_once_per_result(shared_npi_games):
+    games, valid_teams = shared_npi_games
+
+    previous = None
+    for iteration in range(1, 4):
+        teams = process_games_iteration(games, valid_teams, previous, iteration)
+        previous = {team_id: team["npi"] for team_id, team in teams.items()}
+
+    assert_counted_by_result(teams["T"])
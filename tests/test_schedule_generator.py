@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from simulator.schedule_generator import SeasonTemplate, fill_schedule
+
+
+def blank_opponents(season, rows):
+    season = season.copy()
+    season.loc[rows, "opponent"] = ""
+    return season
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_fill_matches_fill_schedule(season, elo_table, seed):
+    rng = np.random.default_rng(seed)
+    season = season.sample(frac=1, random_state=seed).reset_index(drop=True)
+    season = blank_opponents(season, rng.choice(len(season), size=8, replace=False))
+    if seed % 2:
+        season["game_number"] = ""
+
+    template = SeasonTemplate(season)
+    for sched in range(3):
+        expected = fill_schedule(season, elo_table, rng=np.random.default_rng([seed, sched]))
+        filled = template.fill(elo_table, rng=np.random.default_rng([seed, sched]))
+        pd.testing.assert_frame_equal(filled, expected)
+
+
+def test_fill_leaves_season_untouched(season, elo_table):
+    season = blank_opponents(season, [3, 9])
+    before = season.copy()
+
+    SeasonTemplate(season).fill(elo_table, rng=np.random.default_rng(0))
+    fill_schedule(season, elo_table, rng=np.random.default_rng(0))
+
+    pd.testing.assert_frame_equal(season, before)
+
+
+def test_fill_renumbering_a_listed_game_falls_back(season, elo_table):
+    # The blank row comes before a listed game of the same day and team, and
+    # the only opponent to draw is that game's, so the listed game becomes
+    # game 2 of the pairing
+    listed = season.iloc[5]
+    blank = listed.copy()
+    blank["opponent"] = ""
+    season = pd.concat([blank.to_frame().T, season], ignore_index=True)
+    only_opponent = elo_table[elo_table["team"] == listed["opponent"]]
+
+    template = SeasonTemplate(season)
+    assert template._number(np.array([listed["opponent"]], dtype=object)) is None
+
+    expected = fill_schedule(season, only_opponent, rng=np.random.default_rng(1))
+    filled = template.fill(only_opponent, rng=np.random.default_rng(1))
+    pd.testing.assert_frame_equal(filled, expected)
+    pairing = filled[
+        (filled["date"] == listed["date"])
+        & (filled["team"] == listed["team"])
+        & (filled["opponent"] == listed["opponent"])
+    ]
+    assert sorted(pairing["game_number"]) == [1, 2]
@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from simulator import run_no_result
+from simulator.npi_solver import iterate_npis
+from simulator.parallel import check_warm_start, schedule_teams
+from simulator.season_table import compile_season
+
+TOLERANCE = 1e-8
+
+
+@pytest.fixture
+def keep_known_season(season):
+    season = season.copy()
+    season.loc[season.index[-40:], ["home_score", "away_score"]] = 0
+    return season
+
+
+def test_warm_start_matches_cold_start(keep_known_season, elo_table):
+    settings = dict(
+        elo_table=elo_table,
+        seed=3,
+        sample_known_results=False,
+        max_iterations=500,
+        tolerance=TOLERANCE,
+    )
+    cold = run_no_result(keep_known_season, 10, **settings)
+    warm = run_no_result(keep_known_season, 10, warm_start=True, **settings)
+
+    assert warm.teams == cold.teams
+    np.testing.assert_allclose(warm.npis, cold.npis, rtol=0, atol=5 * TOLERANCE)
+
+
+@pytest.mark.parametrize("backend", ["numpy", "python"])
+def test_reference_replicate_stops_after_one_full_pass(keep_known_season, elo_table, backend):
+    table = compile_season(
+        keep_known_season, elo_table, schedule_teams(keep_known_season), False
+    )
+    start = table.warm_start(500, TOLERANCE, backend)
+
+    npis, _, _, convergence = iterate_npis(
+        table.team,
+        table.opponent,
+        start.won,
+        len(table.teams),
+        500,
+        TOLERANCE,
+        start=start,
+        backend=backend,
+    )
+
+    assert convergence["iterations"] == 1
+    assert convergence["residual"] < TOLERANCE
+    np.testing.assert_allclose(npis, start.npis, rtol=0, atol=TOLERANCE)
+
+
+def test_warm_start_rejects_resampled_known_results(season, elo_table):
+    check_warm_start(True, False)
+    check_warm_start(False, True)
+    with pytest.raises(ValueError):
+        check_warm_start(True, True)
+    with pytest.raises(ValueError):
+        run_no_result(
+            season, 2, elo_table=elo_table, seed=1, sample_known_results=True, warm_start=True
+        )